@@ -14,10 +14,11 @@ avoiding state pollution from asyncio/D-Bus interactions.
 
 import logging
 import multiprocessing as mp
-import subprocess
+import struct
 import time
 from datetime import datetime
-from typing import Callable, List, Optional
+from multiprocessing.connection import Connection, wait
+from typing import Callable, Dict, List, Optional
 
 from src.models import OxiReading
 
@@ -27,124 +28,208 @@ logger = logging.getLogger(__name__)
 RX_UUID = "0734594a-a8e7-4b1a-a6b1-cd5243059a57"  # Receive notifications
 TX_UUID = "8b00ace7-eb0b-49b0-bbe9-9aee0a26e1a3"  # Send commands
 
+# BlueZ adapter used for on-demand discovery, and how long to scan
+ADAPTER_PATH = "/org/bluez/hci0"
+DISCOVERY_SECONDS = 5
 
-def _ble_worker(mac_address: str, read_interval: int, queue: mp.Queue, stop_event: mp.Event):
+# Upper bound on one connect attempt, including the fallback scan
+CONNECT_TIMEOUT_SECONDS = 45
+
+# Repeats of the same reconnect-chatter log line within this window are
+# counted instead of logged (see CheckmeO2Reader._log_once)
+LOG_DEDUP_WINDOW_SECONDS = 30.0
+
+# Receive buffer capacity - sensor packets are 21 bytes, so this holds
+# several MTU-sized bursts before we give up and resync. Must be a power
+# of two (see _RxRing).
+RX_BUFFER_SIZE = 256
+
+# Scratch space for one complete sensor packet (7-byte header, 13-byte
+# payload, CRC)
+PACKET_BUFFER_SIZE = 32
+
+# Worker -> parent messages. Readings are sent as fixed-width packed bytes
+# (epoch ms, spo2, heart_rate, battery_level, movement); everything else is
+# a tuple tagged by its first element:
+#   (MSG_STATUS, status, extra)
+#   (MSG_ERROR, message)
+READING_STRUCT = struct.Struct("<QBBBB")
+MSG_STATUS = "s"
+MSG_ERROR = "e"
+
+# Seconds to wait before reconnect attempt N (the last entry repeats).
+# Spaces out retries so flaky BLE peripherals get time to recover.
+RECONNECT_BACKOFF_SCHEDULE = [5, 15, 30, 60]
+
+
+def _backoff_delay(failures: int) -> int:
+    """Return the reconnect delay after ``failures`` consecutive failures."""
+    index = min(failures - 1, len(RECONNECT_BACKOFF_SCHEDULE) - 1)
+    index = max(0, index)  # Ensure non-negative
+    return RECONNECT_BACKOFF_SCHEDULE[index]
+
+
+def _crc8_slow(data) -> int:
+    """Bit-serial CRC-8 (poly 0x07) used by the Viatom command protocol."""
+    crc = 0x00
+    for b in data:
+        chk = (crc ^ b) & 0xFF
+        crc = 0x00
+        if chk & 0x01: crc ^= 0x07
+        if chk & 0x02: crc ^= 0x0e
+        if chk & 0x04: crc ^= 0x1c
+        if chk & 0x08: crc ^= 0x38
+        if chk & 0x10: crc ^= 0x70
+        if chk & 0x20: crc ^= 0xe0
+        if chk & 0x40: crc ^= 0xc7
+        if chk & 0x80: crc ^= 0x89
+    return crc
+
+
+# One lookup per byte instead of eight bit tests
+_CRC8_TABLE = bytes(_crc8_slow(bytes([i])) for i in range(256))
+
+
+def _calc_crc(data) -> int:
+    """Calculate CRC for command packet."""
+    crc = 0x00
+    for b in data:
+        crc = _CRC8_TABLE[crc ^ b]
+    return crc
+
+
+def _build_command(cmd: int) -> bytearray:
+    """Build command packet with header and CRC."""
+    pkt = bytearray([
+        0xAA,
+        cmd,
+        0xFF ^ cmd,
+        0x00, 0x00,
+        0x00, 0x00,
+    ])
+    pkt.append(_calc_crc(pkt))
+    return pkt
+
+
+# The only command the worker sends, built once. Kept as a bytearray, the
+# type BLE_GATT's D-Bus write has always been given; it is never mutated.
+_CMD_REQUEST_READING = _build_command(0x17)  # Request sensor values
+
+
+def _ble_worker(mac_address: str, read_interval: int, msg_conn: Connection, stop_conn: Connection):
     """
     BLE worker function that runs in a separate process.
 
     This function contains all GLib/BLE logic and runs in a pristine
     process environment, avoiding any state pollution from asyncio.
+
+    Messages go to the parent over the write end of a one-way pipe
+    (``msg_conn``). The parent signals shutdown by closing its end of
+    ``stop_conn``; the read end is watched by the GLib main loop so the
+    worker wakes immediately instead of polling.
     """
+    import os
     import signal
-    import subprocess
+    import threading
+
+    def send(msg):
+        """Send a message to the parent, ignoring a parent that has gone away."""
+        try:
+            msg_conn.send(msg)
+        except OSError:
+            pass
 
     # Ignore SIGINT in worker - parent handles shutdown
     signal.signal(signal.SIGINT, signal.SIG_IGN)
 
-    # Connection timeout handler
-    class ConnectionTimeout(Exception):
-        pass
-
-    def timeout_handler(signum, frame):
-        raise ConnectionTimeout("BLE connection timed out")
-
-    signal.signal(signal.SIGALRM, timeout_handler)
+    def connect_timed_out():
+        """A connect() hung past the deadline - exit so the parent respawns us."""
+        send((MSG_ERROR, f"Connection timed out after {CONNECT_TIMEOUT_SECONDS}s"))
+        os._exit(1)
 
     # --- HELPER: Force Scan on Demand ---
     def force_device_discovery(mac):
         """
         Force BlueZ to find the device by scanning briefly.
         This repopulates the BlueZ internal cache if the adapter was reset.
+
+        Talks to org.bluez.Adapter1 over D-Bus directly rather than
+        spawning bash/timeout/bluetoothctl.
         """
-        queue.put({"type": "status", "message": "scanning", "mac": mac})
+        send((MSG_STATUS, "scanning", mac))
         try:
-            # Run scan for 5 seconds then kill it
-            # Using 'timeout' command to ensure it doesn't hang
-            subprocess.run(
-                "timeout 5s bash -c 'echo -e \"scan on\" | bluetoothctl'",
-                shell=True,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
+            from gi.repository import GLib
+            from pydbus import SystemBus
+
+            adapter = SystemBus().get("org.bluez", ADAPTER_PATH)
+            # Only LE advertisements matter for the oximeter
+            adapter.SetDiscoveryFilter({"Transport": GLib.Variant("s", "le")})
+            adapter.StartDiscovery()
+            try:
+                time.sleep(DISCOVERY_SECONDS)
+            finally:
+                adapter.StopDiscovery()
             # Small settling time for BlueZ to process advertisements
             time.sleep(1)
         except Exception as e:
-            queue.put({"type": "error", "message": f"Scan failed: {e}"})
+            send((MSG_ERROR, f"Scan failed: {e}"))
 
     try:
         import BLE_GATT
     except ImportError as e:
-        queue.put({"type": "error", "message": f"BLE_GATT not available: {e}"})
+        send((MSG_ERROR, f"BLE_GATT not available: {e}"))
         return
 
+    def stop_requested():
+        """True once the parent has closed (or written to) the stop pipe."""
+        return stop_conn.poll()
+
     # State
-    rx_buffer = bytearray()
+    rx_ring = _RxRing(RX_BUFFER_SIZE)  # Reused across notifications and sessions
+    packet_buf = bytearray(PACKET_BUFFER_SIZE)  # Reused for every sensor packet
+    # Zero-copy window for payload parsing; packet_buf is never resized
+    packet_view = memoryview(packet_buf)
     last_reading_time = 0
     wait_for = -1  # Infinite
 
-    def calc_crc(data):
-        """Calculate CRC for command packet."""
-        crc = 0x00
-        for b in data:
-            chk = (crc ^ b) & 0xFF
-            crc = 0x00
-            if chk & 0x01: crc ^= 0x07
-            if chk & 0x02: crc ^= 0x0e
-            if chk & 0x04: crc ^= 0x1c
-            if chk & 0x08: crc ^= 0x38
-            if chk & 0x10: crc ^= 0x70
-            if chk & 0x20: crc ^= 0xe0
-            if chk & 0x40: crc ^= 0xc7
-            if chk & 0x80: crc ^= 0x89
-        return crc
-
-    def build_command(cmd):
-        """Build command packet with header and CRC."""
-        pkt = bytearray([
-            0xAA,
-            cmd,
-            0xFF ^ cmd,
-            0x00, 0x00,
-            0x00, 0x00,
-        ])
-        pkt.append(calc_crc(pkt))
-        return pkt
-
     def request_reading():
         """Send command 0x17 to request sensor values."""
-        cmd = build_command(0x17)
-        ble.char_write(TX_UUID, cmd)
+        ble.char_write(TX_UUID, _CMD_REQUEST_READING)
 
     def handle_notification(value):
         """Handle incoming BLE notification."""
-        nonlocal rx_buffer, last_reading_time, wait_for
-
-        rx_buffer.extend(bytearray(value))
-
-        # Look for complete packet (starts with 0x55)
-        while len(rx_buffer) > 0 and rx_buffer[0] != 0x55:
-            rx_buffer = rx_buffer[1:]
-
-        if len(rx_buffer) < 8:
-            return
-
-        # Check payload length
-        pay_len = rx_buffer[5] | (rx_buffer[6] << 8)
-        total_len = pay_len + 8
-
-        if len(rx_buffer) < total_len:
-            return
-
-        # Extract packet
-        packet = rx_buffer[:total_len]
-        rx_buffer = rx_buffer[total_len:]
-
-        # Parse payload (skip 7-byte header)
-        if pay_len == 0x0d:  # Sensor reading
-            payload = packet[7:7+pay_len]
-            process_reading(payload)
-
-    def process_reading(payload: bytes):
+        if not rx_ring.write(value):
+            # No complete packet in a full buffer - drop it and resync
+            rx_ring.clear()
+            if not rx_ring.write(value):
+                return
+
+        while True:
+            # Look for complete packet (starts with 0x55)
+            start = rx_ring.find(0x55)
+            if start < 0:
+                rx_ring.clear()
+                return
+            rx_ring.consume(start)
+
+            if rx_ring.size < 8:
+                return
+
+            # Check payload length
+            pay_len = rx_ring.byte(5) | (rx_ring.byte(6) << 8)
+            total_len = pay_len + 8
+
+            if rx_ring.size < total_len:
+                return
+
+            # Parse payload (skip 7-byte header)
+            if pay_len == 0x0d:  # Sensor reading
+                rx_ring.consume_into(packet_buf, total_len)
+                process_reading(packet_view[7:7+pay_len])
+            else:
+                rx_ring.consume(total_len)
+
+    def process_reading(payload: memoryview):
         """Process sensor reading payload and send to parent."""
         nonlocal last_reading_time, wait_for
 
@@ -170,95 +255,240 @@ def _ble_worker(mac_address: str, read_interval: int, queue: mp.Queue, stop_even
         last_reading_time = now
 
         # Send reading to parent process
-        reading_data = {
-            "type": "reading",
-            "timestamp": datetime.now().isoformat(),
-            "spo2": spo2,
-            "heart_rate": hr,
-            "battery_level": battery,
-            "movement": movement,
-        }
-        queue.put(reading_data)
+        send(READING_STRUCT.pack(int(now * 1000), spo2, hr, battery, movement))
+
+    def end_session():
+        """Leave the worker's GLib main loop, ending the current session."""
+        main_loop.quit()
+
+    def close_connection():
+        """Disconnect from the device and drop its notification handler.
+
+        On a dropped link BLE_GATT's cleanup() can fail in StopNotify before
+        the PropertiesChanged subscription is removed. The old handler would
+        then stay registered next to the next session's one and feed every
+        notification into rx_ring twice, so exit instead and let the parent
+        respawn a clean process.
+        """
+        try:
+            ble.cleanup()
+        except Exception as e:
+            send((MSG_ERROR, f"BLE cleanup failed, restarting worker: {e}"))
+            os._exit(1)
+
+    def drop_unsubscribed():
+        """Release a Central that never got as far as subscribing."""
+        if ble is None:
+            return
+        try:
+            ble.disconnect()
+        except Exception:
+            pass  # Never connected, nothing to tear down
 
     def periodic_request():
         """Periodically request readings (recurring timer)."""
-        if stop_event.is_set():
+        nonlocal request_timer
+        if stop_requested():
             return False  # Stop the timer
-        request_reading()
+        try:
+            request_reading()
+        except Exception as e:
+            # Device dropped off - end this session so we reconnect
+            send((MSG_ERROR, f"Reading request failed: {e}"))
+            request_timer = None
+            end_session()
+            return False
         return True  # Keep the timer running
 
-    def check_stop():
-        """Periodically check if parent wants us to stop."""
-        if stop_event.is_set():
-            ble.cleanup()
-            return False  # Stop checking
-        return True  # Keep checking
+    def on_stop(fd, condition):
+        """Parent closed the stop pipe - tear down and leave the main loop."""
+        end_session()
+        return False  # Remove the watch
 
     # --- Main worker logic ---
-    queue.put({"type": "status", "message": "connecting", "mac": mac_address})
+    # The worker stays alive across disconnects: only the BLE connection is
+    # rebuilt, with backoff between attempts. The parent respawns the
+    # process only if it actually dies.
+    from gi.repository import GLib
 
-    # Set 45-second timeout for connection (allows for scan time)
-    signal.alarm(45)
+    # Our own main loop (rather than BLE_GATT's hidden one) so a session can
+    # be ended with a plain quit() before the connection is torn down
+    main_loop = GLib.MainLoop()
+
+    # Wake up as soon as the parent closes the stop pipe
+    GLib.io_add_watch(
+        stop_conn.fileno(),
+        GLib.PRIORITY_HIGH,
+        GLib.IO_IN | GLib.IO_HUP,
+        on_stop,
+    )
+
+    failures = 0  # Consecutive failures, drives the backoff
+    attempts = 0  # Connection attempts since the last successful connect
+    request_timer = None
+    ble = None
+
+    while not stop_requested():
+        if failures:
+            # Back off, but wake immediately if the parent asks us to stop
+            if stop_conn.poll(_backoff_delay(failures)):
+                break
+
+        send((MSG_STATUS, "connecting", mac_address))
+        attempts += 1
+        rx_ring.clear()
+        ble = None
+
+        # A blocked connect() can't be interrupted from Python, so a timer
+        # thread ends the process instead (allows for scan time)
+        connect_watchdog = threading.Timer(CONNECT_TIMEOUT_SECONDS, connect_timed_out)
+        connect_watchdog.daemon = True
+        connect_watchdog.start()
 
-    try:
-        # Create BLE connection
-        ble = BLE_GATT.Central(mac_address)
+        try:
+            # Create BLE connection
+            ble = BLE_GATT.Central(mac_address)
+
+            # Connect with Retry Logic
+            try:
+                # Attempt 1: Direct Connect (Optimistic)
+                ble.connect()
+            except Exception:
+                # Attempt 2: Scan first, then Connect
+                # This fixes the "Device Not Found" error if cache was wiped
+                send((MSG_STATUS, "retrying_with_scan", None))
+                force_device_discovery(mac_address)
+                ble.connect()
+
+        except Exception as e:
+            failures += 1
+            drop_unsubscribed()
+            send((MSG_ERROR, str(e)))
+            send((MSG_STATUS, "connect_failed", _backoff_delay(failures)))
+            continue
+        finally:
+            connect_watchdog.cancel()
+
+        send((MSG_STATUS, "connected", attempts))
+        failures = 0
+        attempts = 0
+
+        if stop_requested():
+            close_connection()
+            break
 
-        # Connect with Retry Logic
         try:
-            # Attempt 1: Direct Connect (Optimistic)
-            ble.connect()
-        except Exception:
-            # Attempt 2: Scan first, then Connect
-            # This fixes the "Device Not Found" error if cache was wiped
-            queue.put({"type": "status", "message": "retrying_with_scan"})
-            
-            # Reset alarm temporarily so we don't timeout during scan
-            signal.alarm(0)
-            force_device_discovery(mac_address)
-            signal.alarm(45)  # Re-arm alarm
-            
-            ble.connect()
-
-        queue.put({"type": "status", "message": "connected", "attempts": 1})
-
-    except ConnectionTimeout:
-        queue.put({"type": "error", "message": "Connection timed out after 45s"})
-        return
-    except Exception as e:
-        queue.put({"type": "error", "message": str(e)})
-        return
-    finally:
-        # Cancel the alarm
-        signal.alarm(0)
+            # Subscribe to notifications
+            ble.on_value_change(RX_UUID, handle_notification)
 
-    if stop_event.is_set():
-        return
+            # Request first reading
+            request_reading()
 
-    # Subscribe to notifications
-    ble.on_value_change(RX_UUID, handle_notification)
+            # Set up recurring timer to request readings every read_interval seconds
+            request_timer = GLib.timeout_add_seconds(read_interval, periodic_request)
 
-    # Set up GLib timers
-    from gi.repository import GLib
+            send((MSG_STATUS, "monitoring", None))
 
-    # Request first reading
-    request_reading()
+            # Run GLib main loop (blocks until end_session() is called)
+            main_loop.run()
+        except Exception as e:
+            send((MSG_ERROR, str(e)))
 
-    # Set up recurring timer to request readings every read_interval seconds
-    GLib.timeout_add_seconds(read_interval, periodic_request)
+        if request_timer is not None:
+            GLib.source_remove(request_timer)
+            request_timer = None
+        close_connection()
 
-    # Set up periodic stop check (every 5 seconds)
-    GLib.timeout_add_seconds(5, check_stop)
+        if not stop_requested():
+            failures = 1
+            send((MSG_STATUS, "disconnected", _backoff_delay(failures)))
 
-    queue.put({"type": "status", "message": "monitoring"})
+    send((MSG_STATUS, "stopped", None))
 
-    # Run GLib main loop (blocks until cleanup() is called)
-    try:
-        ble.wait_for_notifications()
-    except Exception as e:
-        queue.put({"type": "error", "message": str(e)})
 
-    queue.put({"type": "status", "message": "stopped"})
+class _RxRing:
+    """Fixed-capacity byte ring used to reassemble notification packets.
+
+    Nothing is reallocated or shifted on the notification path: writes
+    copy into the ring and consuming bytes only advances ``head``. The
+    capacity is a power of two so indices wrap with a mask.
+    """
+
+    __slots__ = ("buf", "mask", "head", "size")
+
+    def __init__(self, capacity: int):
+        if capacity <= 0 or capacity & (capacity - 1):
+            raise ValueError(f"Ring capacity must be a power of two, got {capacity}")
+        self.buf = bytearray(capacity)
+        self.mask = capacity - 1
+        self.head = 0  # Index of the first unread byte
+        self.size = 0  # Number of unread bytes
+
+    def clear(self):
+        """Drop all buffered bytes."""
+        self.head = 0
+        self.size = 0
+
+    def write(self, data) -> bool:
+        """Append data; returns False (ring unchanged) if it doesn't fit."""
+        n = len(data)
+        cap = self.mask + 1
+        if self.size + n > cap:
+            return False
+        tail = (self.head + self.size) & self.mask
+        if tail + n <= cap:
+            self.buf[tail:tail + n] = data
+        else:
+            first = cap - tail
+            self.buf[tail:] = data[:first]
+            self.buf[:n - first] = data[first:]
+        self.size += n
+        return True
+
+    def byte(self, offset: int) -> int:
+        """Return the unread byte at ``offset``."""
+        return self.buf[(self.head + offset) & self.mask]
+
+    def find(self, value: int) -> int:
+        """Return the offset of the first unread ``value`` byte, or -1."""
+        cap = self.mask + 1
+        end = self.head + self.size
+        if end <= cap:
+            i = self.buf.find(value, self.head, end)
+            return i - self.head if i >= 0 else -1
+        i = self.buf.find(value, self.head, cap)
+        if i >= 0:
+            return i - self.head
+        i = self.buf.find(value, 0, end - cap)
+        return i + cap - self.head if i >= 0 else -1
+
+    def consume(self, n: int):
+        """Discard the first ``n`` unread bytes."""
+        self.size -= n
+        # Rewind when empty so the next write is contiguous
+        self.head = (self.head + n) & self.mask if self.size else 0
+
+    def consume_into(self, out: bytearray, n: int):
+        """Copy the first ``n`` unread bytes into ``out[:n]`` and discard them."""
+        cap = self.mask + 1
+        first = min(n, cap - self.head)
+        out[:first] = self.buf[self.head:self.head + first]
+        if first < n:
+            out[first:n] = self.buf[:n - first]
+        self.consume(n)
+
+
+def _make_reading(raw: tuple) -> OxiReading:
+    """Build an OxiReading from a raw (timestamp, spo2, hr, battery, movement) tuple."""
+    timestamp, spo2, heart_rate, battery_level, movement = raw
+    return OxiReading(
+        timestamp=datetime.fromtimestamp(timestamp),
+        spo2=spo2,
+        heart_rate=heart_rate,
+        battery_level=battery_level,
+        movement=movement,
+        is_valid=True,
+    )
 
 
 class CheckmeO2Reader:
@@ -284,22 +514,28 @@ class CheckmeO2Reader:
 
         # Process management
         self._process: Optional[mp.Process] = None
-        self._queue: Optional[mp.Queue] = None
-        self._stop_event: Optional[mp.Event] = None
+        self._msg_conn: Optional[Connection] = None
+        self._stop_conn: Optional[Connection] = None
 
         # State (updated from worker messages)
         self._connected = False
         self._running = False
-        self._last_reading: Optional[OxiReading] = None
+        # Readings are kept as raw worker tuples and only turned into
+        # OxiReading objects when someone actually asks for them
+        self._last_raw: Optional[tuple] = None
+        self._last_reading: Optional[OxiReading] = None  # Cache for _last_raw
         self._last_reading_time: float = 0
         self._battery_level: int = 0
-        self._readings: List[OxiReading] = []
+        self._readings_raw: List[tuple] = []
 
         # Connection health tracking
         self._consecutive_failures: int = 0
         self._disconnect_start_time: Optional[float] = None
         self._last_successful_reading_time: Optional[float] = None
 
+        # Log de-duplication: key -> [time last shown, repeats suppressed since]
+        self._log_dedup: Dict[str, list] = {}
+
         # Use 'spawn' context for clean process state
         self._mp_context = mp.get_context('spawn')
 
@@ -317,10 +553,69 @@ class CheckmeO2Reader:
 
         This prevents overwhelming flaky BLE peripherals that need time to recover.
         """
-        backoff_schedule = [5, 15, 30, 60]
-        index = min(self._consecutive_failures - 1, len(backoff_schedule) - 1)
-        index = max(0, index)  # Ensure non-negative
-        return backoff_schedule[index]
+        return _backoff_delay(self._consecutive_failures)
+
+    def _record_failure(self, reason: str, backoff_delay: Optional[int] = None) -> int:
+        """Count a connection failure and log it with escalating severity.
+
+        Args:
+            reason: Short description of what failed, used as the log prefix
+            backoff_delay: Delay before the next attempt, if already decided
+                (the worker picks its own); defaults to _get_backoff_delay()
+
+        Returns:
+            The backoff delay in seconds
+        """
+        self._consecutive_failures += 1
+        self._connected = False
+
+        # Track when disconnect started
+        if self._disconnect_start_time is None:
+            self._disconnect_start_time = time.time()
+
+        # Calculate disconnect duration
+        disconnect_duration = time.time() - self._disconnect_start_time
+        disconnect_mins = int(disconnect_duration / 60)
+        disconnect_secs = int(disconnect_duration % 60)
+
+        # Calculate exponential backoff delay
+        if backoff_delay is None:
+            backoff_delay = self._get_backoff_delay()
+
+        # Log with escalating severity based on consecutive failures
+        if self._consecutive_failures == 1:
+            logger.warning(f"{reason}, waiting {backoff_delay}s before retrying...")
+        elif self._consecutive_failures == 5:
+            logger.warning(f"BLE connection issues: 5 consecutive failures over {disconnect_mins}m {disconnect_secs}s, backing off to {backoff_delay}s")
+        elif self._consecutive_failures == 10:
+            logger.error(f"BLE connection issues: 10 consecutive failures over {disconnect_mins}m {disconnect_secs}s - adapter may need reset")
+        elif self._consecutive_failures == 20:
+            logger.error(f"BLE connection issues: 20 consecutive failures over {disconnect_mins}m {disconnect_secs}s - check device and adapter")
+        elif self._consecutive_failures % 20 == 0:
+            logger.error(f"BLE connection issues: {self._consecutive_failures} consecutive failures over {disconnect_mins}m {disconnect_secs}s")
+        else:
+            logger.warning(f"{reason} (failure #{self._consecutive_failures}, outage: {disconnect_mins}m {disconnect_secs}s), waiting {backoff_delay}s...")
+
+        return backoff_delay
+
+    def _log_once(self, level: int, key: str, msg: str, *args):
+        """Log a message, collapsing repeats of the same key.
+
+        During an outage the worker reports the same statuses and errors on
+        every reconnect attempt. A key already shown within
+        LOG_DEDUP_WINDOW_SECONDS is only counted; the count is appended the
+        next time the message is let through.
+        """
+        now = time.time()
+        entry = self._log_dedup.get(key)
+        if entry is not None and now - entry[0] < LOG_DEDUP_WINDOW_SECONDS:
+            entry[1] += 1
+            return
+        if entry is not None and entry[1]:
+            msg += " (repeated %d times in the last %ds)"
+            args += (entry[1], int(now - entry[0]))
+        self._log_dedup[key] = [now, 0]
+        logger.log(level, msg, *args)
 
     @property
     def is_connected(self) -> bool:
@@ -328,30 +623,53 @@ class CheckmeO2Reader:
 
     @property
     def last_reading(self) -> Optional[OxiReading]:
+        if self._last_reading is None and self._last_raw is not None:
+            self._last_reading = _make_reading(self._last_raw)
         return self._last_reading
 
+    def _materialize_all(self) -> List[OxiReading]:
+        """Build OxiReading objects for every raw reading collected so far."""
+        return [_make_reading(raw) for raw in self._readings_raw]
+
     @property
     def battery_level(self) -> Optional[int]:
         return self._battery_level if self._connected else None
 
     def _start_worker(self):
         """Start the BLE worker process."""
-        self._queue = self._mp_context.Queue()
-        self._stop_event = self._mp_context.Event()
+        # Release the pipes of a previous (dead) worker
+        self._close_pipes()
+        self._msg_conn, msg_writer = self._mp_context.Pipe(duplex=False)
+        stop_reader, self._stop_conn = self._mp_context.Pipe(duplex=False)
 
         self._process = self._mp_context.Process(
             target=_ble_worker,
-            args=(self.mac_address, self.read_interval, self._queue, self._stop_event),
+            args=(self.mac_address, self.read_interval, msg_writer, stop_reader),
             daemon=True,
         )
         self._process.start()
+        # The worker holds its own copies of these ends
+        msg_writer.close()
+        stop_reader.close()
         logger.info(f"BLE worker process started (PID: {self._process.pid})")
 
+    def _close_pipes(self):
+        """Close the parent's ends of the worker pipes."""
+        for conn in (self._msg_conn, self._stop_conn):
+            if conn is not None:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+        self._msg_conn = None
+        self._stop_conn = None
+
     def _stop_worker(self):
         """Stop the BLE worker process."""
-        if self._stop_event:
+        if self._stop_conn:
             try:
-                self._stop_event.set()
+                # Closing the write end wakes the worker's GLib loop
+                self._stop_conn.close()
             except Exception:
                 pass
 
@@ -364,7 +682,7 @@ class CheckmeO2Reader:
                         process.terminate()
                         process.join(timeout=2)
             except Exception as e:
-                logger.debug(f"Error during worker stop: {e}")
+                logger.debug("Error during worker stop: %s", e)
 
         self._process = None
         self._connected = False
@@ -373,7 +691,7 @@ class CheckmeO2Reader:
         """Start BLE reader in subprocess and process readings."""
         self._running = True
         self._connected = False
-        self._readings = []
+        self._readings_raw = []
         self._last_reading_time = time.time()  # Initialize to now
         self._consecutive_failures = 0
         self._disconnect_start_time = None
@@ -386,128 +704,129 @@ class CheckmeO2Reader:
             while self._running:
                 # Check if process died
                 if self._process and not self._process.is_alive():
-                    self._consecutive_failures += 1
-
-                    # Track when disconnect started
-                    if self._disconnect_start_time is None:
-                        self._disconnect_start_time = time.time()
-
-                    # Calculate disconnect duration
-                    disconnect_duration = time.time() - self._disconnect_start_time
-                    disconnect_mins = int(disconnect_duration / 60)
-                    disconnect_secs = int(disconnect_duration % 60)
-
-                    # Calculate exponential backoff delay
-                    backoff_delay = self._get_backoff_delay()
-
-                    # Log with escalating severity based on consecutive failures
-                    if self._consecutive_failures == 1:
-                        logger.warning(f"BLE worker process died, waiting {backoff_delay}s before restarting...")
-                    elif self._consecutive_failures == 5:
-                        logger.warning(f"BLE connection issues: 5 consecutive failures over {disconnect_mins}m {disconnect_secs}s, backing off to {backoff_delay}s")
-                    elif self._consecutive_failures == 10:
-                        logger.error(f"BLE connection issues: 10 consecutive failures over {disconnect_mins}m {disconnect_secs}s - adapter may need reset")
-                    elif self._consecutive_failures == 20:
-                        logger.error(f"BLE connection issues: 20 consecutive failures over {disconnect_mins}m {disconnect_secs}s - check device and adapter")
-                    elif self._consecutive_failures % 20 == 0:
-                        logger.error(f"BLE connection issues: {self._consecutive_failures} consecutive failures over {disconnect_mins}m {disconnect_secs}s")
-                    else:
-                        logger.warning(f"BLE worker died (failure #{self._consecutive_failures}, outage: {disconnect_mins}m {disconnect_secs}s), waiting {backoff_delay}s...")
-
+                    backoff_delay = self._record_failure("BLE worker process died")
                     time.sleep(backoff_delay)
                     self._start_worker()
 
-                try:
-                    # Non-blocking check with timeout
-                    msg = self._queue.get(timeout=1.0)
-                    self._handle_worker_message(msg)
-
-                    # Check if we have enough readings
-                    if num_readings > 0 and len(self._readings) >= num_readings:
-                        break
+                conn = self._msg_conn
+                process = self._process
+                if conn is None or process is None:
+                    break  # stop() was called from another thread
 
-                except Exception:
-                    # Queue timeout - nothing to do
-                    pass
+                try:
+                    # Sleep until a message arrives or the worker exits - no
+                    # periodic polling. The timeout is only a safety net.
+                    ready = wait([conn, process.sentinel], timeout=30)
+                    if conn not in ready:
+                        continue  # Worker exited; handled at the top of the loop
+
+                    # Handle the first message, then drain anything else
+                    # that arrived so a burst is handled in one wakeup
+                    self._handle_worker_message(conn.recv())
+                    while (num_readings <= 0 or len(self._readings_raw) < num_readings) and conn.poll():
+                        self._handle_worker_message(conn.recv())
+                except EOFError:
+                    # Worker closed its end - give it a moment to exit so the
+                    # liveness check above picks it up
+                    if self._process is not None:
+                        self._process.join(timeout=1.0)
+                    continue
+                except OSError:
+                    break  # Pipe closed by stop() from another thread
+
+                # Check if we have enough readings
+                if num_readings > 0 and len(self._readings_raw) >= num_readings:
+                    break
 
         except KeyboardInterrupt:
             logger.info("Interrupted")
         finally:
             self.stop()
 
-        return self._readings
+        return self._materialize_all()
 
-    def _handle_worker_message(self, msg: dict):
+    def _handle_worker_message(self, msg):
         """Handle a message from the worker process."""
-        msg_type = msg.get("type")
+        if type(msg) is bytes:
+            ts_ms, spo2, heart_rate, battery_level, movement = READING_STRUCT.unpack(msg)
+            self._handle_reading(ts_ms / 1000, spo2, heart_rate, battery_level, movement)
+            return
+
+        msg_type = msg[0]
 
-        if msg_type == "status":
-            status = msg.get("message")
+        if msg_type == MSG_STATUS:
+            status = msg[1]
             if status == "connecting":
-                logger.info(f"Connecting to {msg.get('mac')}...")
+                self._log_once(logging.INFO, "connecting", "Connecting to %s...", msg[2])
             elif status == "connected":
                 self._connected = True
                 self._last_reading_time = time.time()
+                # Start the next outage with a clean slate
+                self._log_dedup.clear()
                 # Log extra detail if recovering from failures
                 if self._consecutive_failures > 0:
-                    logger.info(f"Connected after {msg.get('attempts')} attempts (recovering from {self._consecutive_failures} failures)")
+                    logger.info(f"Connected after {msg[2]} attempts (recovering from {self._consecutive_failures} failures)")
                 else:
-                    logger.info(f"Connected after {msg.get('attempts')} attempts")
+                    logger.info(f"Connected after {msg[2]} attempts")
             elif status == "retrying_with_scan":
-                logger.debug(f"Direct connection failed, forcing scan to repopulate cache...")
+                self._log_once(logging.DEBUG, "retrying_with_scan", "Direct connection failed, forcing scan to repopulate cache...")
             elif status == "scanning":
-                logger.debug("Scanning for device...")
+                self._log_once(logging.DEBUG, "scanning", "Scanning for device...")
             elif status == "monitoring":
                 logger.info("Monitoring (readings: infinite)...")
+            elif status == "connect_failed":
+                self._record_failure("BLE connection attempt failed", msg[2])
+            elif status == "disconnected":
+                self._record_failure("BLE device disconnected", msg[2])
             elif status == "stopped":
                 self._connected = False
                 logger.info("BLE worker stopped")
 
-        elif msg_type == "reading":
-            reading = OxiReading(
-                timestamp=datetime.fromisoformat(msg["timestamp"]),
-                spo2=msg["spo2"],
-                heart_rate=msg["heart_rate"],
-                battery_level=msg["battery_level"],
-                movement=msg.get("movement", 0),
-                is_valid=True,
-            )
-
-            self._last_reading = reading
-            self._last_reading_time = time.time()
-            self._battery_level = reading.battery_level
-            self._readings.append(reading)
-
-            # Log recovery summary if we had failures
-            if self._consecutive_failures > 0:
-                outage_duration = 0
-                if self._disconnect_start_time:
-                    outage_duration = time.time() - self._disconnect_start_time
-                outage_mins = int(outage_duration / 60)
-                outage_secs = int(outage_duration % 60)
-                logger.info(f"CONNECTION RECOVERED: {self._consecutive_failures} failures over {outage_mins}m {outage_secs}s outage")
-
-                # Reset tracking
-                self._consecutive_failures = 0
-                self._disconnect_start_time = None
-
-            # Track last successful reading time
-            self._last_successful_reading_time = time.time()
-
-            logger.info(f"Reading: SpO2={reading.spo2}%, HR={reading.heart_rate}bpm, Battery={reading.battery_level}%")
-
-            # Call user callback
-            if self.callback:
+        elif msg_type == MSG_ERROR:
+            error_msg = msg[1] or "Unknown error"
+            self._log_once(logging.ERROR, "error:" + error_msg, "BLE worker error: %s", error_msg)
+            if self.error_callback:
                 try:
-                    self.callback(reading)
+                    self.error_callback(error_msg)
                 except Exception as e:
-                    logger.error(f"Error in callback: {e}")
+                    logger.error(f"Error in error callback: {e}")
 
-        elif msg_type == "error":
-            error_msg = msg.get("message", "Unknown error")
-            logger.error(f"BLE worker error: {error_msg}")
-            if self.error_callback:
-                self.error_callback(error_msg)
+    def _handle_reading(self, timestamp: float, spo2: int, heart_rate: int, battery_level: int, movement: int):
+        """Handle a sensor reading sent by the worker process."""
+        raw = (timestamp, spo2, heart_rate, battery_level, movement)
+
+        now = time.time()
+        self._last_raw = raw
+        self._last_reading = None  # Built on demand by the last_reading property
+        self._last_reading_time = now
+        self._battery_level = battery_level
+        self._readings_raw.append(raw)
+
+        # Log recovery summary if we had failures
+        if self._consecutive_failures > 0:
+            outage_duration = 0
+            if self._disconnect_start_time:
+                outage_duration = now - self._disconnect_start_time
+            outage_mins = int(outage_duration / 60)
+            outage_secs = int(outage_duration % 60)
+            logger.info(f"CONNECTION RECOVERED: {self._consecutive_failures} failures over {outage_mins}m {outage_secs}s outage")
+
+            # Reset tracking
+            self._consecutive_failures = 0
+            self._disconnect_start_time = None
+
+        # Track last successful reading time
+        self._last_successful_reading_time = now
+
+        logger.info("Reading: SpO2=%d%%, HR=%dbpm, Battery=%d%%", spo2, heart_rate, battery_level)
+
+        # Call user callback (built once here and reused by last_reading)
+        if self.callback:
+            reading = self._last_reading = _make_reading(raw)
+            try:
+                self.callback(reading)
+            except Exception as e:
+                logger.error(f"Error in callback: {e}")
 
     def stop(self):
         """Stop the BLE reader subprocess."""
@@ -515,9 +834,7 @@ class CheckmeO2Reader:
         self._running = False
 
         self._stop_worker()
-
-        self._queue = None
-        self._stop_event = None
+        self._close_pipes()
         logger.info("BLE reader stopped")
 
     def disconnect(self):
@@ -10,13 +10,15 @@ Loads configuration from YAML file with environment variable substitution.
 
 import os
 import re
+import stat
+import sys
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, get_args, get_origin, get_type_hints
 
-import yaml
-from dotenv import load_dotenv
+from src.models import DATACLASS_SLOTS
 
 logger = logging.getLogger(__name__)
 
@@ -26,8 +28,22 @@ CONFIG_PATHS = [
     "config.yaml",        # Default config
 ]
 
+# Environment variable values treated as "on"
+_TRUTHY = frozenset(("true", "1", "yes"))
 
-@dataclass
+# Matches ${VAR_NAME} placeholders in config string values
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+# Same pattern for the raw file bytes (collects the names a file references)
+_ENV_VAR_BYTES_RE = re.compile(rb'\$\{([^}]+)\}')
+
+# Distinguishes an unset environment variable from one set to ""
+_MISSING = object()
+
+# (yaml module, Loader, Dumper), imported on first use by _yaml()
+_YAML: Optional[tuple] = None
+
+
+@dataclass(**DATACLASS_SLOTS)
 class OximeterConfig:
     """Oximeter device configuration."""
     mac_address: str = ""
@@ -35,21 +51,21 @@ class OximeterConfig:
     read_interval_seconds: int = 10
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SmartPlugConfig:
     """Smart plug configuration."""
     ip_address: str = ""
     name: str = "AVAPS Power Monitor"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DevicesConfig:
     """Device configuration container."""
     oximeter: OximeterConfig = field(default_factory=OximeterConfig)
     smart_plug: SmartPlugConfig = field(default_factory=SmartPlugConfig)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SpO2ThresholdConfig:
     """SpO2 monitoring thresholds."""
     alarm_level: int = 90
@@ -57,21 +73,21 @@ class SpO2ThresholdConfig:
     warning_level: int = 92
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AVAPSThresholdConfig:
     """AVAPS power thresholds."""
     on_watts: float = 30.0
     window_minutes: int = 5
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BLEThresholdConfig:
     """BLE connection thresholds."""
     reconnect_alert_minutes: int = 3
     max_reconnect_attempts: Optional[int] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BluetoothConfig:
     """Bluetooth timing configuration."""
     # How often to poll for readings (seconds)
@@ -84,7 +100,7 @@ class BluetoothConfig:
     bt_restart_threshold_minutes: int = 5
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ThresholdsConfig:
     """Threshold configuration container (legacy - see AlertsConfig for new system)."""
     spo2: SpO2ThresholdConfig = field(default_factory=SpO2ThresholdConfig)
@@ -94,7 +110,7 @@ class ThresholdsConfig:
 
 # ==================== Unified Alert Configuration System ====================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SleepHoursConfig:
     """Configuration for sleep hours.
 
@@ -105,21 +121,31 @@ class SleepHoursConfig:
     start: str = "22:00"
     end: str = "07:00"
 
+    # Internal: (start, end, start minutes, end minutes) for the last parsed
+    # start/end strings; re-parsed when either is reassigned (settings API)
+    _minutes: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
+    @staticmethod
+    def _to_minutes(hhmm: str) -> int:
+        """Convert "HH:MM" (or "HH") to minutes after midnight."""
+        parts = hhmm.split(":")
+        return int(parts[0]) * 60 + (int(parts[1]) if len(parts) > 1 else 0)
+
     def is_sleep_hours(self, hour: int, minute: int = 0) -> bool:
         """Check if a given time is within sleep hours.
 
         Handles overnight ranges (e.g., 22:00-07:00).
         """
-        start_parts = self.start.split(":")
-        end_parts = self.end.split(":")
-        start_hour = int(start_parts[0])
-        start_min = int(start_parts[1]) if len(start_parts) > 1 else 0
-        end_hour = int(end_parts[0])
-        end_min = int(end_parts[1]) if len(end_parts) > 1 else 0
+        cached = self._minutes
+        if cached is None or cached[0] is not self.start or cached[1] is not self.end:
+            cached = self._minutes = (
+                self.start, self.end,
+                self._to_minutes(self.start), self._to_minutes(self.end),
+            )
 
         current = hour * 60 + minute
-        start = start_hour * 60 + start_min
-        end = end_hour * 60 + end_min
+        start = cached[2]
+        end = cached[3]
 
         if start <= end:
             # Same day range (e.g., 09:00-17:00)
@@ -129,7 +155,7 @@ class SleepHoursConfig:
             return current >= start or current < end
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AlertItemConfig:
     """Unified configuration for a single alert type.
 
@@ -150,8 +176,14 @@ class AlertItemConfig:
     bypass_on_therapy: bool = False
     resend_interval_seconds: int = 300  # Default 5 minutes
 
+    def __post_init__(self):
+        # Only a handful of severities exist; share one string object for
+        # each instead of a separate copy per alert from the YAML parser
+        if type(self.severity) is str:
+            self.severity = sys.intern(self.severity)
+
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AlertsConfig:
     """Container for all alert configurations.
 
@@ -208,7 +240,7 @@ class AlertsConfig:
     sleep_hours: SleepHoursConfig = field(default_factory=SleepHoursConfig)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PagerDutyConfig:
     """PagerDuty alerting configuration."""
     enabled: bool = True
@@ -217,7 +249,7 @@ class PagerDutyConfig:
     service_name: str = "O2 Monitor"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class LocalAudioConfig:
     """Local audio alerting configuration."""
     enabled: bool = True
@@ -228,14 +260,14 @@ class LocalAudioConfig:
     repeat_interval_seconds: int = 30
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AlexaConfig:
     """Alexa alerting configuration."""
     enabled: bool = False
     notify_me_access_code: str = ""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class HealthchecksConfig:
     """Healthchecks.io configuration."""
     enabled: bool = True
@@ -243,7 +275,7 @@ class HealthchecksConfig:
     interval_seconds: int = 60
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AlertingConfig:
     """Alerting configuration container."""
     pagerduty: PagerDutyConfig = field(default_factory=PagerDutyConfig)
@@ -252,7 +284,7 @@ class AlertingConfig:
     healthchecks: HealthchecksConfig = field(default_factory=HealthchecksConfig)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MessagesConfig:
     """Alert message templates."""
     spo2_alarm: str = "Medical alert! Oxygen level critical. Check on Dad immediately."
@@ -260,7 +292,7 @@ class MessagesConfig:
     system_error: str = "O2 monitoring system error. Requires attention."
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class WebConfig:
     """Web dashboard configuration."""
     host: str = "0.0.0.0"
@@ -269,14 +301,14 @@ class WebConfig:
     debug: bool = False
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class UserConfig:
     """User account configuration."""
     username: str = ""
     password_hash: str = ""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AuthConfig:
     """Authentication configuration."""
     session_timeout_minutes: int = 30
@@ -285,7 +317,7 @@ class AuthConfig:
     users: List[UserConfig] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RetentionConfig:
     """Data retention configuration."""
     readings_days: int = 30
@@ -293,14 +325,14 @@ class RetentionConfig:
     events_days: int = 90
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DatabaseConfig:
     """Database configuration."""
     path: str = "data/history.db"
     retention: RetentionConfig = field(default_factory=RetentionConfig)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class LoggingConfig:
     """Logging configuration."""
     level: str = "INFO"
@@ -309,7 +341,7 @@ class LoggingConfig:
     backup_count: int = 5
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Config:
     """Main configuration container.
 
@@ -338,35 +370,164 @@ class Config:
         return self._base_path / p
 
 
+def _yaml() -> tuple:
+    """Import PyYAML on first use.
+
+    yaml (and dotenv) are only needed to read or write the config file,
+    so importing src.config for the dataclasses alone stays cheap.
+
+    Returns:
+        Tuple of (yaml module, Loader class, Dumper class)
+    """
+    global _YAML
+    if _YAML is None:
+        import yaml
+
+        # Prefer the libyaml-backed C loader/dumper; fall back to pure Python
+        try:
+            from yaml import CSafeDumper as Dumper, CSafeLoader as Loader
+        except ImportError:
+            from yaml import SafeDumper as Dumper, SafeLoader as Loader
+        _YAML = (yaml, Loader, Dumper)
+    return _YAML
+
+
+def _env_value(var_name: str, env: Dict[str, str]) -> str:
+    """Return the value of an environment variable (empty if unset).
+
+    Only a variable that is missing from the environment is warned about;
+    one that is set to an empty string is used as-is. Results are memoized
+    in env, so each variable is looked up (and warned about) once per load.
+
+    Args:
+        var_name: Environment variable name
+        env: Per-load memo of variable name -> substituted value
+    """
+    env_value = env.get(var_name)
+    if env_value is None:
+        env_value = os.environ.get(var_name, _MISSING)
+        if env_value is _MISSING:
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(f"Environment variable {var_name} not set")
+            env_value = ""
+        env[var_name] = env_value
+    return env_value
+
+
+def _expand_env_string(value: str, env: Dict[str, str]) -> str:
+    """Expand ${VAR} placeholders in a string that contains '${'."""
+    # Most placeholders are the whole value ("${VAR}"): look it up directly
+    # instead of going through the regex
+    if (value.startswith('${') and value.endswith('}') and len(value) > 3
+            and '}' not in value[2:-1] and value.find('${', 2) < 0):
+        return _env_value(value[2:-1], env)
+    return _ENV_VAR_RE.sub(lambda match: _env_value(match.group(1), env), value)
+
+
+def _substitute_env_vars_inplace(obj: Any, env: Dict[str, str]) -> None:
+    """Substitute ${VAR} patterns in string leaves of a parsed YAML tree.
+
+    Dicts and lists are updated in place; only strings that contain a
+    placeholder are replaced.
+
+    Args:
+        obj: Parsed YAML container (dict or list) to update
+        env: Per-load memo of variable name -> substituted value
+    """
+    # Safe-loaded YAML only yields exact str/dict/list, never subclasses,
+    # so exact type checks are enough (and cheaper than isinstance)
+    obj_type = type(obj)
+    if obj_type is dict:
+        items = obj.items()
+    elif obj_type is list:
+        items = enumerate(obj)
+    else:
+        return
+
+    for key, value in items:
+        value_type = type(value)
+        if value_type is str:
+            # Most strings have no placeholder - skip the regex entirely
+            if '${' in value:
+                # Replacing the value of an existing key/index is safe mid-iteration
+                obj[key] = _expand_env_string(value, env)
+        elif value_type is dict or value_type is list:
+            _substitute_env_vars_inplace(value, env)
+
+
 def _substitute_env_vars(value: Any) -> Any:
     """Recursively substitute ${VAR} patterns with environment variables.
 
+    Containers are modified in place (see _substitute_env_vars_inplace).
+    Each variable is read from the environment once per call.
+
     Args:
         value: Value to process (can be str, dict, list, or other)
 
     Returns:
         Value with environment variables substituted
     """
-    if isinstance(value, str):
-        # Pattern matches ${VAR_NAME}
-        pattern = r'\$\{([^}]+)\}'
-
-        def replace_env(match):
-            var_name = match.group(1)
-            env_value = os.environ.get(var_name, "")
-            if not env_value:
-                logger.warning(f"Environment variable {var_name} not set")
-            return env_value
+    env: Dict[str, str] = {}
+    if type(value) is str:
+        if '${' not in value:
+            return value
+        return _expand_env_string(value, env)
 
-        return re.sub(pattern, replace_env, value)
+    _substitute_env_vars_inplace(value, env)
+    return value
 
-    elif isinstance(value, dict):
-        return {k: _substitute_env_vars(v) for k, v in value.items()}
 
-    elif isinstance(value, list):
-        return [_substitute_env_vars(item) for item in value]
+# Names of the AlertsConfig fields that hold an AlertItemConfig (every alert
+# type), in declaration order
+ALERT_ITEM_FIELDS = tuple(f.name for f in fields(AlertsConfig) if f.type is AlertItemConfig)
 
-    return value
+# Every config dataclass, for the field classification in _plan
+_DATACLASS_TYPES = frozenset((
+    OximeterConfig, SmartPlugConfig, DevicesConfig, SpO2ThresholdConfig,
+    AVAPSThresholdConfig, BLEThresholdConfig, BluetoothConfig,
+    ThresholdsConfig, SleepHoursConfig, AlertItemConfig, AlertsConfig,
+    PagerDutyConfig, LocalAudioConfig, AlexaConfig, HealthchecksConfig,
+    AlertingConfig, MessagesConfig, WebConfig, UserConfig, AuthConfig,
+    RetentionConfig, DatabaseConfig, LoggingConfig, Config,
+))
+
+# Field kinds used by the _dict_to_dataclass conversion plans
+_SCALAR = 0        # Stored as-is
+_NESTED = 1        # Nested dataclass, converted recursively
+_NESTED_LIST = 2   # List of dataclasses (e.g. auth.users)
+
+def _plan(cls) -> tuple:
+    """Classify each public field of a dataclass once.
+
+    Args:
+        cls: The dataclass type to plan
+
+    Returns:
+        Tuple of (field_name, kind, target_cls) entries
+    """
+    hints = get_type_hints(cls)
+    plan = []
+    for field_name in cls.__dataclass_fields__:
+        if field_name.startswith('_'):
+            continue
+
+        field_type = hints[field_name]
+        args = get_args(field_type)
+        # is_dataclass() is only a fallback for dataclasses defined elsewhere
+        if field_type in _DATACLASS_TYPES or is_dataclass(field_type):
+            plan.append((field_name, _NESTED, field_type))
+        elif (get_origin(field_type) is list and args
+              and (args[0] in _DATACLASS_TYPES or is_dataclass(args[0]))):
+            plan.append((field_name, _NESTED_LIST, args[0]))
+        else:
+            plan.append((field_name, _SCALAR, None))
+    return tuple(plan)
+
+
+# Per-dataclass conversion plans, built at import for every config
+# dataclass (others are planned on first use):
+#   cls -> ((field_name, kind, target_cls), ...)
+_DC_PLANS: Dict[type, tuple] = {cls: _plan(cls) for cls in _DATACLASS_TYPES}
 
 
 def _dict_to_dataclass(cls, data: Dict[str, Any]):
@@ -382,49 +543,27 @@ def _dict_to_dataclass(cls, data: Dict[str, Any]):
     if data is None:
         return cls()
 
-    # Get field types from dataclass
-    field_types = {f.name: f.type for f in cls.__dataclass_fields__.values()}
+    plan = _DC_PLANS.get(cls)
+    if plan is None:
+        plan = _DC_PLANS[cls] = _plan(cls)
 
     kwargs = {}
-    for field_name, field_type in field_types.items():
-        if field_name.startswith('_'):
-            continue
-
+    for field_name, kind, target in plan:
         if field_name not in data:
             continue
 
         value = data[field_name]
 
-        # Handle nested dataclasses
-        if hasattr(field_type, '__dataclass_fields__'):
-            kwargs[field_name] = _dict_to_dataclass(field_type, value)
-
-        # Handle List[UserConfig] special case
-        elif field_name == 'users' and isinstance(value, list):
+        if kind == _NESTED:
+            kwargs[field_name] = _dict_to_dataclass(target, value)
+        elif kind == _NESTED_LIST and isinstance(value, list):
             kwargs[field_name] = [
-                _dict_to_dataclass(UserConfig, u) if isinstance(u, dict) else u
-                for u in value
+                _dict_to_dataclass(target, item) if isinstance(item, dict) else item
+                for item in value
             ]
-
-        # Handle Optional types
-        elif hasattr(field_type, '__origin__') and field_type.__origin__ is type(None):
-            kwargs[field_name] = value
-
         else:
             kwargs[field_name] = value
 
-    # Special handling for AlertsConfig - convert alert items
-    if cls == AlertsConfig and data:
-        alert_fields = ['spo2_critical_off_therapy', 'spo2_critical_on_therapy', 'spo2_warning',
-                        'hr_high', 'hr_low', 'disconnect',
-                        'no_therapy_at_night_info', 'no_therapy_at_night_high',
-                        'battery_warning', 'battery_critical']
-        for alert_name in alert_fields:
-            if alert_name in data and isinstance(data[alert_name], dict):
-                kwargs[alert_name] = _dict_to_dataclass(AlertItemConfig, data[alert_name])
-        if 'sleep_hours' in data and isinstance(data['sleep_hours'], dict):
-            kwargs['sleep_hours'] = _dict_to_dataclass(SleepHoursConfig, data['sleep_hours'])
-
     return cls(**kwargs)
 
 
@@ -442,49 +581,67 @@ def load_config(config_path: Optional[str] = None, base_path: Optional[Path] = N
         FileNotFoundError: If no config file is found
         yaml.YAMLError: If config file is invalid YAML
     """
+    # List the base directory once; both the .env and config file probes
+    # use these entries instead of stat'ing each candidate path. Plain
+    # os.path strings are used until the config file itself is chosen.
+    base_dir = os.fspath(base_path) if base_path else os.getcwd()
+    try:
+        with os.scandir(base_dir) as it:
+            entries = {entry.name: entry for entry in it}
+    except OSError:
+        entries = {}
+
+    def _is_file(name: str) -> bool:
+        entry = entries.get(name)
+        return entry is not None and entry.is_file()
+
     # Load .env file if present
-    env_path = Path(base_path or Path.cwd()) / ".env"
-    if env_path.exists():
+    env_path = os.path.join(base_dir, ".env")
+    if _is_file(".env"):
+        from dotenv import load_dotenv
         load_dotenv(env_path)
         logger.debug(f"Loaded environment from {env_path}")
 
-    # Also check MOCK_HARDWARE env var
-    if os.environ.get("MOCK_HARDWARE", "").lower() in ("true", "1", "yes"):
+    # Also check MOCK_HARDWARE env var (after .env, which may set it)
+    mock_env = os.environ.get("MOCK_HARDWARE", "").lower() in _TRUTHY
+    if mock_env:
         logger.info("MOCK_HARDWARE environment variable set - enabling mock mode")
 
     # Find config file
     if config_path:
-        config_file = Path(config_path)
-        if not config_file.exists():
+        if not os.path.exists(config_path):
             raise FileNotFoundError(f"Config file not found: {config_path}")
+        config_file = Path(config_path)
     else:
-        base = base_path or Path.cwd()
-        config_file = None
-        for path in CONFIG_PATHS:
-            candidate = base / path
-            if candidate.exists():
-                config_file = candidate
-                break
+        name = next((p for p in CONFIG_PATHS if _is_file(p)), None)
 
-        if config_file is None:
+        if name is None:
             raise FileNotFoundError(
                 f"No config file found. Searched: {', '.join(CONFIG_PATHS)}"
             )
+        config_file = Path(os.path.join(base_dir, name))
 
     logger.info(f"Loading config from {config_file}")
 
     # Load YAML
-    with open(config_file, 'r') as f:
-        raw_config = yaml.safe_load(f)
+    yaml, loader, _ = _yaml()
+    # Bytes go straight to libyaml, which does its own decoding
+    with open(config_file, 'rb') as f:
+        raw_bytes = f.read()
+    raw_config = yaml.load(raw_bytes, Loader=loader)
 
     if raw_config is None:
         raw_config = {}
 
-    # Substitute environment variables
-    config_data = _substitute_env_vars(raw_config)
+    env_names = sorted({name.decode('utf-8', 'replace')
+                        for name in _ENV_VAR_BYTES_RE.findall(raw_bytes)})
+
+    # Substitute environment variables (env_names lists every ${VAR} in the
+    # file, so an empty list means there is nothing to walk for)
+    config_data = _substitute_env_vars(raw_config) if env_names else raw_config
 
     # Check for MOCK_HARDWARE env var override
-    if os.environ.get("MOCK_HARDWARE", "").lower() in ("true", "1", "yes"):
+    if mock_env:
         config_data["mock_mode"] = True
 
     # Convert to Config dataclass
@@ -497,6 +654,16 @@ def load_config(config_path: Optional[str] = None, base_path: Optional[Path] = N
     return config
 
 
+# Hard validation failures: (predicate that is True when invalid, message).
+# Soft problems that can be fixed up are clamped in _validate_config instead.
+_VALIDATION_RULES: Tuple[Tuple[Callable[[Config], bool], str], ...] = (
+    (
+        lambda c: not c.mock_mode and not c.devices.oximeter.mac_address,
+        "devices.oximeter.mac_address is required (or enable mock_mode)",
+    ),
+)
+
+
 def _validate_config(config: Config) -> None:
     """Validate configuration settings.
 
@@ -506,11 +673,7 @@ def _validate_config(config: Config) -> None:
     Raises:
         ValueError: If required settings are missing or invalid
     """
-    errors = []
-
-    # Check oximeter MAC if not in mock mode
-    if not config.mock_mode and not config.devices.oximeter.mac_address:
-        errors.append("devices.oximeter.mac_address is required (or enable mock_mode)")
+    errors = [msg for is_invalid, msg in _VALIDATION_RULES if is_invalid(config)]
 
     # Check web secret key
     if not config.web.secret_key:
@@ -550,6 +713,74 @@ def get_default_config() -> Config:
     return Config()
 
 
+# Fields saved for each alert item by save_config
+_SAVED_ALERT_FIELDS = tuple(f.name for f in fields(AlertItemConfig) if not f.name.startswith('_'))
+
+
+def _is_literal_value(value: Optional[str]) -> bool:
+    """True if a secret is set and isn't an unexpanded ${VAR} placeholder."""
+    return bool(value) and not value.startswith('${')
+
+
+# YAML sections save_config rewrites from scratch (keys not listed in
+# _SAVE_PLAN are dropped); all other sections keep their unlisted keys
+_SAVE_REPLACED_SECTIONS = (
+    ('thresholds', 'spo2'),
+    ('thresholds', 'avaps'),
+    ('alerts',),
+    ('bluetooth',),
+)
+
+# Every value save_config writes, built once at import:
+#   (YAML key path, getter on Config, predicate or None)
+# A value with a predicate is only written if the predicate accepts it.
+# Entries are in the order keys should appear when they are new to the file.
+_SAVE_PLAN: Tuple[Tuple[Tuple[str, ...], Callable[[Config], Any],
+                        Optional[Callable[[Any], bool]]], ...] = tuple(
+    (tuple(dotted.split('.')), attrgetter(dotted), should_save)
+    for dotted, should_save in (
+        ('thresholds.spo2.alarm_level', None),
+        ('thresholds.spo2.alarm_duration_seconds', None),
+        ('thresholds.spo2.warning_level', None),
+        ('thresholds.avaps.on_watts', None),
+        ('thresholds.avaps.window_minutes', None),
+        *((f'alerts.{name}.{key}', None)
+          for name in ALERT_ITEM_FIELDS for key in _SAVED_ALERT_FIELDS),
+        ('alerts.sleep_hours.start', None),
+        ('alerts.sleep_hours.end', None),
+        ('alerting.local_audio.enabled', None),
+        ('alerting.local_audio.volume', None),
+        # Only save routing_key/ping_url if they're not env var placeholders
+        ('alerting.pagerduty.routing_key', _is_literal_value),
+        ('alerting.healthchecks.ping_url', _is_literal_value),
+        ('devices.smart_plug.ip_address', None),
+        ('bluetooth.read_interval_seconds', None),
+        ('bluetooth.late_reading_seconds', None),
+        ('bluetooth.respawn_delay_seconds', None),
+        ('bluetooth.bt_restart_threshold_minutes', None),
+    )
+)
+
+
+def _apply_plan(existing: Dict[str, Any], config: Config, plan: tuple) -> None:
+    """Copy config values into a parsed YAML dict following a save plan.
+
+    Args:
+        existing: Parsed YAML data to update in place
+        config: Config object to read values from
+        plan: Tuple of (key path, getter, predicate or None) entries
+    """
+    for path, get_value, should_save in plan:
+        value = get_value(config)
+        if should_save is not None and not should_save(value):
+            continue
+
+        data = existing
+        for key in path[:-1]:
+            data = data.setdefault(key, {})
+        data[path[-1]] = value
+
+
 def save_config(config: Config, config_path: str = "config.yaml") -> None:
     """Save configuration changes back to YAML file.
 
@@ -560,83 +791,47 @@ def save_config(config: Config, config_path: str = "config.yaml") -> None:
         config: Config object with current settings
         config_path: Path to config file to update
     """
+    yaml, loader, dumper = _yaml()
     config_file = Path(config_path)
 
     # Read existing file to preserve comments
-    if config_file.exists():
-        with open(config_file, 'r') as f:
-            existing = yaml.safe_load(f) or {}
+    file_exists = config_file.exists()
+    if file_exists:
+        with open(config_file, 'rb') as f:
+            existing = yaml.load(f, Loader=loader) or {}
     else:
         existing = {}
-
-    # Update values from config object
-    existing['thresholds'] = existing.get('thresholds', {})
-    existing['thresholds']['spo2'] = {
-        'alarm_level': config.thresholds.spo2.alarm_level,
-        'alarm_duration_seconds': config.thresholds.spo2.alarm_duration_seconds,
-        'warning_level': config.thresholds.spo2.warning_level,
-    }
-    existing['thresholds']['avaps'] = {
-        'on_watts': config.thresholds.avaps.on_watts,
-        'window_minutes': config.thresholds.avaps.window_minutes,
-    }
-
-    # Save alerts configuration (unified format)
-    def _save_alert_item(alert_cfg):
-        return {
-            'enabled': alert_cfg.enabled,
-            'threshold': alert_cfg.threshold,
-            'duration_seconds': alert_cfg.duration_seconds,
-            'severity': alert_cfg.severity,
-            'bypass_on_therapy': alert_cfg.bypass_on_therapy,
-            'resend_interval_seconds': alert_cfg.resend_interval_seconds,
-        }
-
-    existing['alerts'] = {
-        'spo2_critical_off_therapy': _save_alert_item(config.alerts.spo2_critical_off_therapy),
-        'spo2_critical_on_therapy': _save_alert_item(config.alerts.spo2_critical_on_therapy),
-        'spo2_warning': _save_alert_item(config.alerts.spo2_warning),
-        'hr_high': _save_alert_item(config.alerts.hr_high),
-        'hr_low': _save_alert_item(config.alerts.hr_low),
-        'disconnect': _save_alert_item(config.alerts.disconnect),
-        'no_therapy_at_night_info': _save_alert_item(config.alerts.no_therapy_at_night_info),
-        'no_therapy_at_night_high': _save_alert_item(config.alerts.no_therapy_at_night_high),
-        'battery_warning': _save_alert_item(config.alerts.battery_warning),
-        'battery_critical': _save_alert_item(config.alerts.battery_critical),
-        'sleep_hours': {
-            'start': config.alerts.sleep_hours.start,
-            'end': config.alerts.sleep_hours.end,
-        },
-    }
-
-    existing['alerting'] = existing.get('alerting', {})
-    existing['alerting']['local_audio'] = existing['alerting'].get('local_audio', {})
-    existing['alerting']['local_audio']['enabled'] = config.alerting.local_audio.enabled
-    existing['alerting']['local_audio']['volume'] = config.alerting.local_audio.volume
-
-    # Only save routing_key/ping_url if they're not env var placeholders
-    if config.alerting.pagerduty.routing_key and not config.alerting.pagerduty.routing_key.startswith('${'):
-        existing['alerting']['pagerduty'] = existing['alerting'].get('pagerduty', {})
-        existing['alerting']['pagerduty']['routing_key'] = config.alerting.pagerduty.routing_key
-
-    if config.alerting.healthchecks.ping_url and not config.alerting.healthchecks.ping_url.startswith('${'):
-        existing['alerting']['healthchecks'] = existing['alerting'].get('healthchecks', {})
-        existing['alerting']['healthchecks']['ping_url'] = config.alerting.healthchecks.ping_url
-
-    existing['devices'] = existing.get('devices', {})
-    existing['devices']['smart_plug'] = existing['devices'].get('smart_plug', {})
-    existing['devices']['smart_plug']['ip_address'] = config.devices.smart_plug.ip_address
-
-    # Save bluetooth configuration
-    existing['bluetooth'] = {
-        'read_interval_seconds': config.bluetooth.read_interval_seconds,
-        'late_reading_seconds': config.bluetooth.late_reading_seconds,
-        'respawn_delay_seconds': config.bluetooth.respawn_delay_seconds,
-        'bt_restart_threshold_minutes': config.bluetooth.bt_restart_threshold_minutes,
-    }
-
-    # Write back
-    with open(config_file, 'w') as f:
-        yaml.dump(existing, f, default_flow_style=False, sort_keys=False)
+    before = repr(existing)
+
+    # Sections written wholesale are emptied in place (keeping their
+    # position in the file); everything else is merged
+    for path in _SAVE_REPLACED_SECTIONS:
+        parent = existing
+        for key in path[:-1]:
+            parent = parent.get(key)
+            if not isinstance(parent, dict):
+                break
+        else:
+            if path[-1] in parent:
+                parent[path[-1]] = {}
+
+    _apply_plan(existing, config, _SAVE_PLAN)
+
+    if file_exists and repr(existing) == before:
+        logger.debug(f"Config unchanged, not rewriting {config_path}")
+        return
+
+    # Emit to one in-memory UTF-8 buffer, then write it with a single call
+    data = yaml.dump(existing, Dumper=dumper, default_flow_style=False, sort_keys=False,
+                     encoding='utf-8')
+
+    # Write back atomically so a crash mid-write can't truncate the config
+    tmp_file = config_file.with_name(config_file.name + ".tmp")
+    with open(tmp_file, 'wb') as f:
+        f.write(data)
+    if file_exists:
+        # Keep the original permissions (the file may hold secrets)
+        os.chmod(tmp_file, stat.S_IMODE(config_file.stat().st_mode))
+    os.replace(tmp_file, config_file)
 
     logger.info(f"Configuration saved to {config_path}")
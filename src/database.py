@@ -22,12 +22,15 @@ Usage:
     await db.close()
 """
 
+import asyncio
 import json
 import logging
 import os
 import sys
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 # Add project root to path when run as script
 if __name__ == "__main__":
@@ -39,6 +42,239 @@ from src.models import Alert, AlertSeverity, AlertType, AVAPSState, OxiReading
 
 logger = logging.getLogger(__name__)
 
+# Connection tuning applied at open. WAL (set separately, file databases
+# only) lets dashboard reads run alongside writes; synchronous=NORMAL is
+# crash-safe in WAL mode and only fsyncs at checkpoints, not every commit.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",      # 64 MB page cache
+    "PRAGMA mmap_size=268435456",    # 256 MB memory-mapped I/O
+    "PRAGMA busy_timeout=5000",      # Wait up to 5s for a lock
+)
+
+# Rows removed per transaction by cleanup_old_data, so a large backlog
+# doesn't hold the write lock or grow the WAL in one huge transaction
+DELETE_CHUNK_SIZE = 5000
+
+# Applied once WAL is on: checkpoint every ~1000 pages (about 4 MB) and
+# truncate the WAL file back to 64 MB after checkpoints so it can't keep
+# growing under sustained writes
+WAL_PRAGMAS = (
+    "PRAGMA wal_autocheckpoint=1000",
+    "PRAGMA journal_size_limit=67108864",
+)
+
+# The read-only connection used by get_* methods refuses writes outright
+READ_CONNECTION_PRAGMAS = ("PRAGMA query_only=1",) + CONNECTION_PRAGMAS
+
+
+def _build_range_queries(table: str, filters: tuple) -> Dict[tuple, str]:
+    """Pre-build SELECT statements for every combination of optional filters.
+
+    Keeping the SQL text identical between calls lets SQLite's per-connection
+    statement cache reuse the prepared statement instead of re-planning it.
+
+    Args:
+        table: Table to select from
+        filters: WHERE clause fragments, in the order of the lookup key
+
+    Returns:
+        Dict mapping a tuple of "filter present" flags to the SQL string
+    """
+    queries = {}
+    for mask in range(1 << len(filters)):
+        key = tuple(bool(mask & (1 << i)) for i in range(len(filters)))
+        conditions = [f for f, present in zip(filters, key) if present]
+        query = f"SELECT * FROM {table}"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY timestamp DESC LIMIT ?"
+        queries[key] = query
+    return queries
+
+
+# Hot-path INSERT statements, shared by the single-row and batch writers so
+# the text (and SQLite's cached prepared statement) is identical everywhere
+_INSERT_READING_SQL = (
+    "INSERT INTO readings (timestamp, spo2, heart_rate, battery_level, movement,"
+    " is_valid, avaps_state, power_watts, source) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_INSERT_ALERT_SQL = (
+    "INSERT INTO alerts (id, timestamp, alert_type, severity, message, spo2,"
+    " heart_rate, avaps_state, pagerduty_dedup_key) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_INSERT_EVENT_SQL = (
+    "INSERT INTO system_events (timestamp, event_type, message, metadata)"
+    " VALUES (?, ?, ?, ?)"
+)
+_INSERT_SESSION_SQL = (
+    "INSERT INTO sessions (session_id, user_id, created_at, last_activity, expires_at)"
+    " VALUES (?, ?, ?, ?, ?)"
+)
+
+# readings_5m keeps per-bucket aggregates of valid readings so
+# get_reading_stats reads one row per 5 minutes instead of every reading.
+# The trigger maintains it on insert; cleanup_old_data rebuilds the bucket
+# its cutoff falls in.
+ROLLUP_BUCKET_US = 5 * 60 * 1_000_000
+
+_ROLLUP_COLUMNS = (
+    "bucket, spo2_min, spo2_max, spo2_sum, spo2_count,"
+    " hr_min, hr_max, hr_sum, hr_count, reading_count"
+)
+
+_CREATE_ROLLUP_TRIGGER_SQL = f"""
+    CREATE TRIGGER IF NOT EXISTS readings_5m_insert
+    AFTER INSERT ON readings
+    WHEN NEW.is_valid = 1
+    BEGIN
+        INSERT INTO readings_5m ({_ROLLUP_COLUMNS})
+        VALUES (
+            NEW.timestamp - NEW.timestamp % {ROLLUP_BUCKET_US},
+            NEW.spo2, NEW.spo2, COALESCE(NEW.spo2, 0), NEW.spo2 IS NOT NULL,
+            NEW.heart_rate, NEW.heart_rate, COALESCE(NEW.heart_rate, 0), NEW.heart_rate IS NOT NULL,
+            1
+        )
+        ON CONFLICT(bucket) DO UPDATE SET
+            spo2_min = MIN(COALESCE(spo2_min, excluded.spo2_min), COALESCE(excluded.spo2_min, spo2_min)),
+            spo2_max = MAX(COALESCE(spo2_max, excluded.spo2_max), COALESCE(excluded.spo2_max, spo2_max)),
+            spo2_sum = spo2_sum + excluded.spo2_sum,
+            spo2_count = spo2_count + excluded.spo2_count,
+            hr_min = MIN(COALESCE(hr_min, excluded.hr_min), COALESCE(excluded.hr_min, hr_min)),
+            hr_max = MAX(COALESCE(hr_max, excluded.hr_max), COALESCE(excluded.hr_max, hr_max)),
+            hr_sum = hr_sum + excluded.hr_sum,
+            hr_count = hr_count + excluded.hr_count,
+            reading_count = reading_count + 1;
+    END
+"""
+
+# Aggregates of valid readings in [?, ?), in readings_5m column order
+_READINGS_AGGREGATE_SQL = """
+    SELECT MIN(spo2), MAX(spo2), COALESCE(SUM(spo2), 0), COUNT(spo2),
+           MIN(heart_rate), MAX(heart_rate), COALESCE(SUM(heart_rate), 0), COUNT(heart_rate),
+           COUNT(*)
+    FROM readings
+    WHERE timestamp >= ? AND timestamp < ? AND is_valid = 1
+"""
+
+# Rebuild rollup buckets for readings in [?, ?)
+_ROLLUP_BACKFILL_SQL = f"""
+    INSERT OR REPLACE INTO readings_5m ({_ROLLUP_COLUMNS})
+    SELECT timestamp - timestamp % {ROLLUP_BUCKET_US} AS bucket,
+           MIN(spo2), MAX(spo2), COALESCE(SUM(spo2), 0), COUNT(spo2),
+           MIN(heart_rate), MAX(heart_rate), COALESCE(SUM(heart_rate), 0), COUNT(heart_rate),
+           COUNT(*)
+    FROM readings
+    WHERE timestamp >= ? AND timestamp < ? AND is_valid = 1
+    GROUP BY bucket
+"""
+
+# Whole buckets in [?, ?) come from readings_5m, the partial buckets at
+# either edge from readings. Averages are sum/count, matching AVG().
+_READING_STATS_SQL = f"""
+    SELECT
+        MIN(spo2_min) as spo2_min,
+        MAX(spo2_max) as spo2_max,
+        SUM(spo2_sum) * 1.0 / SUM(spo2_count) as spo2_avg,
+        MIN(hr_min) as hr_min,
+        MAX(hr_max) as hr_max,
+        SUM(hr_sum) * 1.0 / SUM(hr_count) as hr_avg,
+        SUM(reading_count) as count
+    FROM (
+        SELECT {_ROLLUP_COLUMNS.replace("bucket, ", "")}
+        FROM readings_5m WHERE bucket >= ? AND bucket < ?
+        UNION ALL
+        {_READINGS_AGGREGATE_SQL}
+        UNION ALL
+        {_READINGS_AGGREGATE_SQL}
+    )
+"""
+
+# Timestamp columns by table. Stored as INTEGER microseconds since the Unix
+# epoch and handed back to callers as ISO-8601 strings.
+TIMESTAMP_COLUMNS = {
+    "readings": ("timestamp",),
+    "alerts": ("timestamp", "acknowledged_at", "resolved_at"),
+    "system_events": ("timestamp",),
+    "users": ("created_at", "last_login"),
+    "sessions": ("created_at", "last_activity", "expires_at"),
+    "api_tokens": ("created_at", "expires_at", "last_used_at"),
+}
+_TIMESTAMP_NAMES = frozenset(c for columns in TIMESTAMP_COLUMNS.values() for c in columns)
+
+_US_PER_DAY = 24 * 60 * 60 * 1_000_000
+
+# Bumped via PRAGMA user_version when a data migration has been applied
+# 1: ISO-8601 text timestamps converted to INTEGER microseconds
+# 2: readings_5m rollup backfilled from existing readings
+SCHEMA_VERSION = 2
+
+
+def _to_us(dt: datetime) -> int:
+    """Convert a datetime (naive = local time) to microseconds since the epoch."""
+    # Split off microseconds so the float from timestamp() can't round them
+    return int(dt.replace(microsecond=0).timestamp()) * 1_000_000 + dt.microsecond
+
+
+def _now_us() -> int:
+    """Current time in microseconds since the epoch, without a datetime."""
+    return time.time_ns() // 1000
+
+
+def _from_us(us: int) -> datetime:
+    """Convert microseconds since the epoch to a naive local datetime."""
+    return datetime.fromtimestamp(us // 1_000_000).replace(microsecond=us % 1_000_000)
+
+
+def _iso_to_us(value: Any) -> Any:
+    """SQL function used by the migration; leaves unparseable values as-is."""
+    if not isinstance(value, str):
+        return value
+    try:
+        return _to_us(datetime.fromisoformat(value))
+    except ValueError:
+        return value
+
+
+def _rows_to_dicts(rows) -> List[Dict[str, Any]]:
+    """Convert result rows to dicts with ISO-8601 timestamp strings."""
+    if not rows:
+        return []
+    # Look the column names up once per result set; zipping them with each
+    # row is about twice as fast as dict(row), which goes through Row.keys()
+    names = rows[0].keys()
+    ts_keys = [key for key in names if key in _TIMESTAMP_NAMES]
+    results = [dict(zip(names, row)) for row in rows]
+    if ts_keys:
+        for d in results:
+            for key in ts_keys:
+                value = d[key]
+                if type(value) is int:
+                    d[key] = _from_us(value).isoformat()
+    return results
+
+
+def _row_to_dict(row) -> Dict[str, Any]:
+    """Convert a single result row, see _rows_to_dicts."""
+    return _rows_to_dicts([row])[0]
+
+
+# Keyed by (has_start, has_end) / (has_start, has_end, has_event_type)
+_TIME_RANGE_FILTERS = ("timestamp >= ?", "timestamp <= ?")
+_READINGS_QUERIES = _build_range_queries("readings", _TIME_RANGE_FILTERS)
+_ALERTS_QUERIES = _build_range_queries("alerts", _TIME_RANGE_FILTERS)
+_EVENTS_QUERIES = _build_range_queries("system_events", _TIME_RANGE_FILTERS + ("event_type = ?",))
+
+# One page of readings in [?, ?], newest first, strictly after the
+# (timestamp, id) of the previous page's last row
+_READINGS_PAGE_SQL = """
+    SELECT * FROM readings
+    WHERE timestamp >= ? AND timestamp <= ? AND (timestamp, id) < (?, ?)
+    ORDER BY timestamp DESC, id DESC
+    LIMIT ?
+"""
+
 
 class Database:
     """Async SQLite database manager for O2 Monitor.
@@ -61,6 +297,7 @@ class Database:
         """
         self.db_path = db_path
         self._connection: Optional[aiosqlite.Connection] = None
+        self._read_connection: Optional[aiosqlite.Connection] = None
         logger.info(f"Database initialized (path: {db_path})")
 
     async def initialize(self) -> None:
@@ -77,11 +314,68 @@ class Database:
         self._connection = await aiosqlite.connect(self.db_path)
         self._connection.row_factory = aiosqlite.Row
 
+        await self._configure_connection()
         await self._create_tables()
+        await self._open_read_connection()
         logger.info("Database initialized and tables created")
 
+    @property
+    def _in_memory(self) -> bool:
+        """True for in-memory databases, which can't be shared or use WAL."""
+        return self.db_path == ":memory:" or "mode=memory" in self.db_path
+
+    async def _open_read_connection(self) -> None:
+        """Open a second, read-only connection for queries.
+
+        aiosqlite runs each connection on its own worker thread, so reads on
+        a separate connection don't queue behind writes; with WAL they also
+        don't block on them in SQLite. Falls back to the primary connection
+        for in-memory databases or if the open fails.
+        """
+        if self._in_memory:
+            return
+        uri = f"{Path(self.db_path).absolute().as_uri()}?mode=ro"
+        try:
+            self._read_connection = await aiosqlite.connect(uri, uri=True)
+            self._read_connection.row_factory = aiosqlite.Row
+            for pragma in READ_CONNECTION_PRAGMAS:
+                await self._read_connection.execute(pragma)
+        except aiosqlite.Error as e:
+            logger.warning(f"Could not open read-only connection, sharing the primary: {e}")
+            if self._read_connection:
+                await self._read_connection.close()
+            self._read_connection = None
+
+    def _reader(self) -> aiosqlite.Connection:
+        """Connection to use for read-only queries."""
+        return self._read_connection or self._connection
+
+    async def _configure_connection(self) -> None:
+        """Switch to WAL journaling and apply WAL_PRAGMAS/CONNECTION_PRAGMAS."""
+        # In-memory databases can't use WAL (SQLite keeps them in "memory" mode)
+        if not self._in_memory:
+            try:
+                async with self._connection.execute("PRAGMA journal_mode=WAL") as cursor:
+                    row = await cursor.fetchone()
+                if row and row[0].lower() == "wal":
+                    for pragma in WAL_PRAGMAS:
+                        await self._connection.execute(pragma)
+                elif row:
+                    logger.warning(f"Could not enable WAL journal mode (using {row[0]})")
+            except aiosqlite.Error as e:
+                logger.warning(f"Could not enable WAL journal mode: {e}")
+
+        for pragma in CONNECTION_PRAGMAS:
+            await self._connection.execute(pragma)
+
     async def close(self) -> None:
         """Close database connection."""
+        if self._connection:
+            # Update statistics for tables this connection's queries hit
+            await self._connection.execute("PRAGMA optimize")
+        if self._read_connection:
+            await self._read_connection.close()
+            self._read_connection = None
         if self._connection:
             await self._connection.close()
             self._connection = None
@@ -94,7 +388,7 @@ class Database:
             await cursor.execute("""
                 CREATE TABLE IF NOT EXISTS readings (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp DATETIME NOT NULL,
+                    timestamp INTEGER NOT NULL,
                     spo2 INTEGER,
                     heart_rate INTEGER,
                     battery_level INTEGER,
@@ -112,6 +406,29 @@ class Database:
                 ON readings(timestamp)
             """)
 
+            # Index for the is_valid = 1 time-range scans in get_reading_stats
+            await cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_readings_valid_ts
+                ON readings(is_valid, timestamp)
+            """)
+
+            # 5-minute rollup of valid readings for get_reading_stats
+            await cursor.execute("""
+                CREATE TABLE IF NOT EXISTS readings_5m (
+                    bucket INTEGER PRIMARY KEY,
+                    spo2_min INTEGER,
+                    spo2_max INTEGER,
+                    spo2_sum INTEGER NOT NULL,
+                    spo2_count INTEGER NOT NULL,
+                    hr_min INTEGER,
+                    hr_max INTEGER,
+                    hr_sum INTEGER NOT NULL,
+                    hr_count INTEGER NOT NULL,
+                    reading_count INTEGER NOT NULL
+                )
+            """)
+            await cursor.execute(_CREATE_ROLLUP_TRIGGER_SQL)
+
             # Migration: Add power_watts column if it doesn't exist
             await cursor.execute("PRAGMA table_info(readings)")
             columns = [row[1] for row in await cursor.fetchall()]
@@ -128,7 +445,7 @@ class Database:
             await cursor.execute("""
                 CREATE TABLE IF NOT EXISTS alerts (
                     id TEXT PRIMARY KEY,
-                    timestamp DATETIME NOT NULL,
+                    timestamp INTEGER NOT NULL,
                     alert_type TEXT NOT NULL,
                     severity TEXT NOT NULL,
                     message TEXT,
@@ -136,10 +453,10 @@ class Database:
                     heart_rate INTEGER,
                     avaps_state TEXT,
                     acknowledged BOOLEAN DEFAULT FALSE,
-                    acknowledged_at DATETIME,
+                    acknowledged_at INTEGER,
                     acknowledged_by TEXT,
                     resolved BOOLEAN DEFAULT FALSE,
-                    resolved_at DATETIME
+                    resolved_at INTEGER
                 )
             """)
 
@@ -149,11 +466,19 @@ class Database:
                 ON alerts(timestamp)
             """)
 
+            # Partial index for get_active_alerts. The predicate must be
+            # written exactly as in the query for SQLite to match it.
+            await cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_alerts_active
+                ON alerts(timestamp DESC)
+                WHERE acknowledged = FALSE AND resolved = FALSE
+            """)
+
             # System events table
             await cursor.execute("""
                 CREATE TABLE IF NOT EXISTS system_events (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp DATETIME NOT NULL,
+                    timestamp INTEGER NOT NULL,
                     event_type TEXT NOT NULL,
                     message TEXT,
                     metadata TEXT
@@ -166,14 +491,20 @@ class Database:
                 ON system_events(timestamp)
             """)
 
+            # Index for get_events filtered by event_type
+            await cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_events_type_ts
+                ON system_events(event_type, timestamp DESC)
+            """)
+
             # Users table
             await cursor.execute("""
                 CREATE TABLE IF NOT EXISTS users (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     username TEXT UNIQUE NOT NULL,
                     password_hash TEXT NOT NULL,
-                    created_at DATETIME NOT NULL,
-                    last_login DATETIME
+                    created_at INTEGER NOT NULL,
+                    last_login INTEGER
                 )
             """)
 
@@ -182,9 +513,9 @@ class Database:
                 CREATE TABLE IF NOT EXISTS sessions (
                     session_id TEXT PRIMARY KEY,
                     user_id INTEGER NOT NULL,
-                    created_at DATETIME NOT NULL,
-                    last_activity DATETIME NOT NULL,
-                    expires_at DATETIME NOT NULL,
+                    created_at INTEGER NOT NULL,
+                    last_activity INTEGER NOT NULL,
+                    expires_at INTEGER NOT NULL,
                     FOREIGN KEY (user_id) REFERENCES users(id)
                 )
             """)
@@ -194,9 +525,9 @@ class Database:
                 CREATE TABLE IF NOT EXISTS api_tokens (
                     token TEXT PRIMARY KEY,
                     username TEXT NOT NULL,
-                    created_at DATETIME NOT NULL,
-                    expires_at DATETIME NOT NULL,
-                    last_used_at DATETIME,
+                    created_at INTEGER NOT NULL,
+                    expires_at INTEGER NOT NULL,
+                    last_used_at INTEGER,
                     device_name TEXT
                 )
             """)
@@ -211,6 +542,22 @@ class Database:
 
             # Migrations - add columns to existing tables
             await self._run_migrations(cursor)
+
+            # Partial index for get_alerts_pending_pagerduty (needs the
+            # migrated pagerduty_dedup_key column). As with idx_alerts_active,
+            # the predicate must match the query text.
+            await cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_alerts_pagerduty_pending
+                ON alerts(timestamp DESC)
+                WHERE pagerduty_dedup_key IS NOT NULL AND resolved = FALSE
+            """)
+            await self._connection.commit()
+
+            # Refresh planner statistics so the composite and partial
+            # indexes get picked. analysis_limit samples each index instead
+            # of reading it all, keeping startup fast on a large database.
+            await cursor.execute("PRAGMA analysis_limit=400")
+            await cursor.execute("ANALYZE")
             await self._connection.commit()
 
     async def _run_migrations(self, cursor) -> None:
@@ -224,6 +571,28 @@ class Database:
                 ALTER TABLE alerts ADD COLUMN pagerduty_dedup_key TEXT
             """)
 
+        # Convert ISO-8601 text timestamps to INTEGER microseconds. Columns
+        # declared DATETIME in older databases have NUMERIC affinity, so they
+        # store the integers natively without rebuilding the tables.
+        await cursor.execute("PRAGMA user_version")
+        version = (await cursor.fetchone())[0]
+        if version < 1:
+            await self._connection.create_function("iso_to_us", 1, _iso_to_us, deterministic=True)
+            for table, columns in TIMESTAMP_COLUMNS.items():
+                for column in columns:
+                    await cursor.execute(f"""
+                        UPDATE {table} SET {column} = iso_to_us({column})
+                        WHERE typeof({column}) = 'text'
+                    """)
+                    if cursor.rowcount > 0:
+                        logger.info(f"Converted {cursor.rowcount} {table}.{column} timestamps to integers")
+        if version < 2:
+            await cursor.execute("DELETE FROM readings_5m")
+            await cursor.execute(_ROLLUP_BACKFILL_SQL, (0, 1 << 62))
+            logger.info(f"Built readings_5m rollup ({cursor.rowcount} buckets)")
+        if version < SCHEMA_VERSION:
+            await cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
     # ==================== Reading Operations ====================
 
     async def insert_reading(
@@ -248,7 +617,7 @@ class Database:
         """
         if reading is not None:
             # Full reading with O2 data
-            ts = reading.timestamp.isoformat()
+            ts = _to_us(reading.timestamp)
             spo2 = reading.spo2
             heart_rate = reading.heart_rate
             battery_level = reading.battery_level
@@ -256,32 +625,66 @@ class Database:
             is_valid = reading.is_valid
         else:
             # Power-only reading (O2 disconnected)
-            ts = (timestamp or datetime.now()).isoformat()
+            ts = _to_us(timestamp) if timestamp else _now_us()
             spo2 = None
             heart_rate = None
             battery_level = None
             movement = None
             is_valid = False
 
-        async with self._connection.cursor() as cursor:
-            await cursor.execute("""
-                INSERT INTO readings
-                (timestamp, spo2, heart_rate, battery_level, movement, is_valid, avaps_state, power_watts, source)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                ts,
-                spo2,
-                heart_rate,
-                battery_level,
-                movement,
-                is_valid,
-                avaps_state.value,
-                power_watts,
-                source,
-            ))
+        async with self._connection.execute(_INSERT_READING_SQL, (
+            ts,
+            spo2,
+            heart_rate,
+            battery_level,
+            movement,
+            is_valid,
+            avaps_state.value,
+            power_watts,
+            source,
+        )) as cursor:
             await self._connection.commit()
             return cursor.lastrowid
 
+    async def insert_readings(
+        self,
+        batch: List[Tuple[OxiReading, AVAPSState]],
+        source: str = 'ble'
+    ) -> int:
+        """Insert several O2 readings in a single transaction.
+
+        One commit (and so one fsync) covers the whole batch, which is much
+        cheaper than calling insert_reading per sample.
+
+        Args:
+            batch: List of (reading, avaps_state) pairs
+            source: Source of readings - 'ble' (default) or 'relay'
+
+        Returns:
+            Number of rows inserted
+        """
+        if not batch:
+            return 0
+
+        params = [
+            (
+                _to_us(reading.timestamp),
+                reading.spo2,
+                reading.heart_rate,
+                reading.battery_level,
+                reading.movement,
+                reading.is_valid,
+                avaps_state.value,
+                None,
+                source,
+            )
+            for reading, avaps_state in batch
+        ]
+
+        await self._connection.executemany(_INSERT_READING_SQL, params)
+        await self._connection.commit()
+        return len(params)
+
     async def get_readings(
         self,
         start_time: Optional[datetime] = None,
@@ -298,28 +701,54 @@ class Database:
         Returns:
             List of reading dictionaries
         """
-        query = "SELECT * FROM readings"
+        query = _READINGS_QUERIES[(bool(start_time), bool(end_time))]
         params = []
-        conditions = []
-
         if start_time:
-            conditions.append("timestamp >= ?")
-            params.append(start_time.isoformat())
-
+            params.append(_to_us(start_time))
         if end_time:
-            conditions.append("timestamp <= ?")
-            params.append(end_time.isoformat())
+            params.append(_to_us(end_time))
+        params.append(limit)
 
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
+        async with self._reader().execute(query, params) as cursor:
+            rows = await cursor.fetchall()
+            return _rows_to_dicts(rows)
 
-        query += " ORDER BY timestamp DESC LIMIT ?"
-        params.append(limit)
+    async def get_readings_page(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        after: Optional[Tuple[int, int]] = None,
+        limit: int = 500
+    ) -> Tuple[List[Dict[str, Any]], Optional[Tuple[int, int]]]:
+        """Get one page of readings within a time range, newest first.
 
-        async with self._connection.cursor() as cursor:
-            await cursor.execute(query, params)
+        Each page is its own short query, so a slow consumer such as a CSV
+        download never keeps a read snapshot open (which would stop WAL
+        checkpoints) between pages.
+
+        Args:
+            start_time: Start of time range (inclusive)
+            end_time: End of time range (inclusive)
+            after: Cursor returned with the previous page, None for the first
+            limit: Maximum number of readings per page
+
+        Returns:
+            Tuple of (reading dictionaries, cursor for the next page or
+            None if this was the last one)
+        """
+        end_us = _to_us(end_time)
+        # The first page starts just past end_time
+        ts, row_id = after if after else (end_us + 1, 0)
+
+        async with self._reader().execute(_READINGS_PAGE_SQL, (
+            _to_us(start_time), end_us, ts, row_id, limit,
+        )) as cursor:
             rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+
+        if len(rows) < limit:
+            return _rows_to_dicts(rows), None
+        last = rows[-1]
+        return _rows_to_dicts(rows), (last["timestamp"], last["id"])
 
     async def get_latest_reading(self) -> Optional[Dict[str, Any]]:
         """Get the most recent reading.
@@ -327,14 +756,13 @@ class Database:
         Returns:
             Most recent reading as dict, or None if no readings
         """
-        async with self._connection.cursor() as cursor:
-            await cursor.execute("""
-                SELECT * FROM readings
-                ORDER BY timestamp DESC
-                LIMIT 1
-            """)
+        async with self._reader().execute("""
+            SELECT * FROM readings
+            ORDER BY timestamp DESC
+            LIMIT 1
+        """) as cursor:
             row = await cursor.fetchone()
-            return dict(row) if row else None
+            return _row_to_dict(row) if row else None
 
     async def get_reading_stats(
         self,
@@ -350,20 +778,19 @@ class Database:
         Returns:
             Dict with min, max, avg for SpO2 and heart rate
         """
-        async with self._connection.cursor() as cursor:
-            await cursor.execute("""
-                SELECT
-                    MIN(spo2) as spo2_min,
-                    MAX(spo2) as spo2_max,
-                    AVG(spo2) as spo2_avg,
-                    MIN(heart_rate) as hr_min,
-                    MAX(heart_rate) as hr_max,
-                    AVG(heart_rate) as hr_avg,
-                    COUNT(*) as count
-                FROM readings
-                WHERE timestamp >= ? AND timestamp <= ?
-                AND is_valid = 1
-            """, (start_time.isoformat(), end_time.isoformat()))
+        start_us = _to_us(start_time)
+        end_us = _to_us(end_time) + 1  # Exclusive bound from here on
+        # Whole buckets inside the range; none if the window is too short
+        first_bucket = -(-start_us // ROLLUP_BUCKET_US) * ROLLUP_BUCKET_US
+        last_bucket = end_us // ROLLUP_BUCKET_US * ROLLUP_BUCKET_US
+        if first_bucket >= last_bucket:
+            first_bucket = last_bucket = end_us
+
+        async with self._reader().execute(_READING_STATS_SQL, (
+            first_bucket, last_bucket,
+            start_us, first_bucket,
+            last_bucket, end_us,
+        )) as cursor:
             row = await cursor.fetchone()
             return dict(row) if row else {}
 
@@ -376,23 +803,18 @@ class Database:
             alert: Alert object to insert
             pagerduty_dedup_key: PagerDuty deduplication key for this alert
         """
-        async with self._connection.cursor() as cursor:
-            await cursor.execute("""
-                INSERT INTO alerts
-                (id, timestamp, alert_type, severity, message, spo2, heart_rate, avaps_state, pagerduty_dedup_key)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                alert.id,
-                alert.timestamp.isoformat(),
-                alert.alert_type.value,
-                alert.severity.value,
-                alert.message,
-                alert.spo2,
-                alert.heart_rate,
-                alert.avaps_state.value if alert.avaps_state else None,
-                pagerduty_dedup_key,
-            ))
-            await self._connection.commit()
+        await self._connection.execute(_INSERT_ALERT_SQL, (
+            alert.id,
+            _to_us(alert.timestamp),
+            alert.alert_type.value,
+            alert.severity.value,
+            alert.message,
+            alert.spo2,
+            alert.heart_rate,
+            alert.avaps_state.value if alert.avaps_state else None,
+            pagerduty_dedup_key,
+        ))
+        await self._connection.commit()
 
     async def get_alerts(
         self,
@@ -410,28 +832,17 @@ class Database:
         Returns:
             List of alert dictionaries
         """
-        query = "SELECT * FROM alerts"
+        query = _ALERTS_QUERIES[(bool(start_time), bool(end_time))]
         params = []
-        conditions = []
-
         if start_time:
-            conditions.append("timestamp >= ?")
-            params.append(start_time.isoformat())
-
+            params.append(_to_us(start_time))
         if end_time:
-            conditions.append("timestamp <= ?")
-            params.append(end_time.isoformat())
-
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
-
-        query += " ORDER BY timestamp DESC LIMIT ?"
+            params.append(_to_us(end_time))
         params.append(limit)
 
-        async with self._connection.cursor() as cursor:
-            await cursor.execute(query, params)
+        async with self._reader().execute(query, params) as cursor:
             rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+            return _rows_to_dicts(rows)
 
     async def get_active_alerts(self) -> List[Dict[str, Any]]:
         """Get all unacknowledged alerts.
@@ -439,14 +850,13 @@ class Database:
         Returns:
             List of active (unacknowledged) alerts
         """
-        async with self._connection.cursor() as cursor:
-            await cursor.execute("""
-                SELECT * FROM alerts
-                WHERE acknowledged = FALSE AND resolved = FALSE
-                ORDER BY timestamp DESC
-            """)
+        async with self._reader().execute("""
+            SELECT * FROM alerts
+            WHERE acknowledged = FALSE AND resolved = FALSE
+            ORDER BY timestamp DESC
+        """) as cursor:
             rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+            return _rows_to_dicts(rows)
 
     async def get_alerts_pending_pagerduty(self) -> List[Dict[str, Any]]:
         """Get unresolved alerts with PagerDuty dedup keys.
@@ -454,15 +864,14 @@ class Database:
         Returns:
             List of alerts that have PagerDuty incidents to check
         """
-        async with self._connection.cursor() as cursor:
-            await cursor.execute("""
-                SELECT * FROM alerts
-                WHERE pagerduty_dedup_key IS NOT NULL
-                  AND resolved = FALSE
-                ORDER BY timestamp DESC
-            """)
+        async with self._reader().execute("""
+            SELECT * FROM alerts
+            WHERE pagerduty_dedup_key IS NOT NULL
+              AND resolved = FALSE
+            ORDER BY timestamp DESC
+        """) as cursor:
             rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+            return _rows_to_dicts(rows)
 
     async def sync_pagerduty_status(
         self,
@@ -482,36 +891,42 @@ class Database:
         Returns:
             True if alert was updated
         """
-        async with self._connection.cursor() as cursor:
-            if resolved:
-                await cursor.execute("""
-                    UPDATE alerts
-                    SET resolved = TRUE,
-                        resolved_at = ?,
-                        acknowledged = TRUE,
-                        acknowledged_at = COALESCE(acknowledged_at, ?),
-                        acknowledged_by = COALESCE(acknowledged_by, ?)
-                    WHERE id = ? AND resolved = FALSE
-                """, (
-                    datetime.now().isoformat(),
-                    datetime.now().isoformat(),
-                    acknowledged_by or 'PagerDuty',
-                    alert_id
-                ))
-            elif acknowledged:
-                await cursor.execute("""
-                    UPDATE alerts
-                    SET acknowledged = TRUE,
-                        acknowledged_at = COALESCE(acknowledged_at, ?),
-                        acknowledged_by = COALESCE(acknowledged_by, ?)
-                    WHERE id = ? AND acknowledged = FALSE
-                """, (
-                    datetime.now().isoformat(),
-                    acknowledged_by or 'PagerDuty',
-                    alert_id
-                ))
+        now = _now_us()
+        if resolved:
+            cursor = await self._connection.execute("""
+                UPDATE alerts
+                SET resolved = TRUE,
+                    resolved_at = ?,
+                    acknowledged = TRUE,
+                    acknowledged_at = COALESCE(acknowledged_at, ?),
+                    acknowledged_by = COALESCE(acknowledged_by, ?)
+                WHERE id = ? AND resolved = FALSE
+            """, (
+                now,
+                now,
+                acknowledged_by or 'PagerDuty',
+                alert_id
+            ))
+        elif acknowledged:
+            cursor = await self._connection.execute("""
+                UPDATE alerts
+                SET acknowledged = TRUE,
+                    acknowledged_at = COALESCE(acknowledged_at, ?),
+                    acknowledged_by = COALESCE(acknowledged_by, ?)
+                WHERE id = ? AND acknowledged = FALSE
+            """, (
+                now,
+                acknowledged_by or 'PagerDuty',
+                alert_id
+            ))
+        else:
+            return False
+
+        try:
             await self._connection.commit()
             return cursor.rowcount > 0
+        finally:
+            await cursor.close()
 
     async def acknowledge_alert(
         self,
@@ -527,14 +942,13 @@ class Database:
         Returns:
             True if alert was found and updated
         """
-        async with self._connection.cursor() as cursor:
-            await cursor.execute("""
-                UPDATE alerts
-                SET acknowledged = TRUE,
-                    acknowledged_at = ?,
-                    acknowledged_by = ?
-                WHERE id = ?
-            """, (datetime.now().isoformat(), acknowledged_by, alert_id))
+        async with self._connection.execute("""
+            UPDATE alerts
+            SET acknowledged = TRUE,
+                acknowledged_at = ?,
+                acknowledged_by = ?
+            WHERE id = ?
+        """, (_now_us(), acknowledged_by, alert_id)) as cursor:
             await self._connection.commit()
             return cursor.rowcount > 0
 
@@ -547,13 +961,12 @@ class Database:
         Returns:
             True if alert was found and updated
         """
-        async with self._connection.cursor() as cursor:
-            await cursor.execute("""
-                UPDATE alerts
-                SET resolved = TRUE,
-                    resolved_at = ?
-                WHERE id = ?
-            """, (datetime.now().isoformat(), alert_id))
+        async with self._connection.execute("""
+            UPDATE alerts
+            SET resolved = TRUE,
+                resolved_at = ?
+            WHERE id = ?
+        """, (_now_us(), alert_id)) as cursor:
             await self._connection.commit()
             return cursor.rowcount > 0
 
@@ -575,17 +988,12 @@ class Database:
         Returns:
             ID of the inserted event
         """
-        async with self._connection.cursor() as cursor:
-            await cursor.execute("""
-                INSERT INTO system_events
-                (timestamp, event_type, message, metadata)
-                VALUES (?, ?, ?, ?)
-            """, (
-                datetime.now().isoformat(),
-                event_type,
-                message,
-                json.dumps(metadata) if metadata else None,
-            ))
+        async with self._connection.execute(_INSERT_EVENT_SQL, (
+            _now_us(),
+            event_type,
+            message,
+            json.dumps(metadata) if metadata else None,
+        )) as cursor:
             await self._connection.commit()
             return cursor.lastrowid
 
@@ -594,7 +1002,8 @@ class Database:
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
         event_type: Optional[str] = None,
-        limit: int = 100
+        limit: int = 100,
+        parse_metadata: bool = True
     ) -> List[Dict[str, Any]]:
         """Get system events.
 
@@ -603,43 +1012,30 @@ class Database:
             end_time: End of time range (inclusive)
             event_type: Filter by event type
             limit: Maximum number of events to return
+            parse_metadata: Decode metadata into a dict; pass False to get
+                the stored JSON text and skip the parse
 
         Returns:
             List of event dictionaries
         """
-        query = "SELECT * FROM system_events"
+        query = _EVENTS_QUERIES[(bool(start_time), bool(end_time), bool(event_type))]
         params = []
-        conditions = []
-
         if start_time:
-            conditions.append("timestamp >= ?")
-            params.append(start_time.isoformat())
-
+            params.append(_to_us(start_time))
         if end_time:
-            conditions.append("timestamp <= ?")
-            params.append(end_time.isoformat())
-
+            params.append(_to_us(end_time))
         if event_type:
-            conditions.append("event_type = ?")
             params.append(event_type)
-
-        if conditions:
-            query += " WHERE " + " AND ".join(conditions)
-
-        query += " ORDER BY timestamp DESC LIMIT ?"
         params.append(limit)
 
-        async with self._connection.cursor() as cursor:
-            await cursor.execute(query, params)
+        async with self._reader().execute(query, params) as cursor:
             rows = await cursor.fetchall()
 
-            # Parse metadata JSON
-            results = []
-            for row in rows:
-                d = dict(row)
-                if d.get("metadata"):
-                    d["metadata"] = json.loads(d["metadata"])
-                results.append(d)
+            results = _rows_to_dicts(rows)
+            if parse_metadata:
+                for d in results:
+                    if d.get("metadata"):
+                        d["metadata"] = json.loads(d["metadata"])
             return results
 
     # ==================== User/Session Operations ====================
@@ -653,12 +1049,11 @@ class Database:
         Returns:
             User dict or None if not found
         """
-        async with self._connection.cursor() as cursor:
-            await cursor.execute("""
-                SELECT * FROM users WHERE username = ?
-            """, (username,))
+        async with self._reader().execute("""
+            SELECT * FROM users WHERE username = ?
+        """, (username,)) as cursor:
             row = await cursor.fetchone()
-            return dict(row) if row else None
+            return _row_to_dict(row) if row else None
 
     async def create_user(
         self,
@@ -674,11 +1069,10 @@ class Database:
         Returns:
             ID of the created user
         """
-        async with self._connection.cursor() as cursor:
-            await cursor.execute("""
-                INSERT INTO users (username, password_hash, created_at)
-                VALUES (?, ?, ?)
-            """, (username, password_hash, datetime.now().isoformat()))
+        async with self._connection.execute("""
+            INSERT INTO users (username, password_hash, created_at)
+            VALUES (?, ?, ?)
+        """, (username, password_hash, _now_us())) as cursor:
             await self._connection.commit()
             return cursor.lastrowid
 
@@ -688,11 +1082,10 @@ class Database:
         Args:
             user_id: ID of user to update
         """
-        async with self._connection.cursor() as cursor:
-            await cursor.execute("""
-                UPDATE users SET last_login = ? WHERE id = ?
-            """, (datetime.now().isoformat(), user_id))
-            await self._connection.commit()
+        await self._connection.execute("""
+            UPDATE users SET last_login = ? WHERE id = ?
+        """, (_now_us(), user_id))
+        await self._connection.commit()
 
     async def create_session(
         self,
@@ -707,22 +1100,17 @@ class Database:
             session_id: Unique session identifier
             expires_minutes: Session expiration time in minutes
         """
-        now = datetime.now()
-        expires_at = now + timedelta(minutes=expires_minutes)
-
-        async with self._connection.cursor() as cursor:
-            await cursor.execute("""
-                INSERT INTO sessions
-                (session_id, user_id, created_at, last_activity, expires_at)
-                VALUES (?, ?, ?, ?, ?)
-            """, (
-                session_id,
-                user_id,
-                now.isoformat(),
-                now.isoformat(),
-                expires_at.isoformat(),
-            ))
-            await self._connection.commit()
+        now = _now_us()
+        expires_at = now + expires_minutes * 60 * 1_000_000
+
+        await self._connection.execute(_INSERT_SESSION_SQL, (
+            session_id,
+            user_id,
+            now,
+            now,
+            expires_at,
+        ))
+        await self._connection.commit()
 
     async def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get session by ID.
@@ -733,15 +1121,14 @@ class Database:
         Returns:
             Session dict or None if not found/expired
         """
-        async with self._connection.cursor() as cursor:
-            await cursor.execute("""
-                SELECT s.*, u.username
-                FROM sessions s
-                JOIN users u ON s.user_id = u.id
-                WHERE s.session_id = ? AND s.expires_at > ?
-            """, (session_id, datetime.now().isoformat()))
+        async with self._reader().execute("""
+            SELECT s.*, u.username
+            FROM sessions s
+            JOIN users u ON s.user_id = u.id
+            WHERE s.session_id = ? AND s.expires_at > ?
+        """, (session_id, _now_us())) as cursor:
             row = await cursor.fetchone()
-            return dict(row) if row else None
+            return _row_to_dict(row) if row else None
 
     async def update_session_activity(self, session_id: str) -> None:
         """Update session last activity time.
@@ -749,11 +1136,10 @@ class Database:
         Args:
             session_id: Session identifier
         """
-        async with self._connection.cursor() as cursor:
-            await cursor.execute("""
-                UPDATE sessions SET last_activity = ? WHERE session_id = ?
-            """, (datetime.now().isoformat(), session_id))
-            await self._connection.commit()
+        await self._connection.execute("""
+            UPDATE sessions SET last_activity = ? WHERE session_id = ?
+        """, (_now_us(), session_id))
+        await self._connection.commit()
 
     async def delete_session(self, session_id: str) -> None:
         """Delete a session.
@@ -761,11 +1147,10 @@ class Database:
         Args:
             session_id: Session identifier to delete
         """
-        async with self._connection.cursor() as cursor:
-            await cursor.execute("""
-                DELETE FROM sessions WHERE session_id = ?
-            """, (session_id,))
-            await self._connection.commit()
+        await self._connection.execute("""
+            DELETE FROM sessions WHERE session_id = ?
+        """, (session_id,))
+        await self._connection.commit()
 
     async def cleanup_expired_sessions(self) -> int:
         """Delete all expired sessions.
@@ -773,10 +1158,9 @@ class Database:
         Returns:
             Number of sessions deleted
         """
-        async with self._connection.cursor() as cursor:
-            await cursor.execute("""
-                DELETE FROM sessions WHERE expires_at < ?
-            """, (datetime.now().isoformat(),))
+        async with self._connection.execute("""
+            DELETE FROM sessions WHERE expires_at < ?
+        """, (_now_us(),)) as cursor:
             await self._connection.commit()
             return cursor.rowcount
 
@@ -797,15 +1181,14 @@ class Database:
             expires_days: Days until token expires
             device_name: Optional device identifier
         """
-        now = datetime.now()
-        expires_at = now + timedelta(days=expires_days)
+        now = _now_us()
+        expires_at = now + expires_days * _US_PER_DAY
 
-        async with self._connection.cursor() as cursor:
-            await cursor.execute("""
-                INSERT INTO api_tokens (token, username, created_at, expires_at, device_name)
-                VALUES (?, ?, ?, ?, ?)
-            """, (token, username, now.isoformat(), expires_at.isoformat(), device_name))
-            await self._connection.commit()
+        await self._connection.execute("""
+            INSERT INTO api_tokens (token, username, created_at, expires_at, device_name)
+            VALUES (?, ?, ?, ?, ?)
+        """, (token, username, now, expires_at, device_name))
+        await self._connection.commit()
 
     async def get_api_token(self, token: str) -> Optional[Dict[str, Any]]:
         """Get API token if valid (not expired).
@@ -816,13 +1199,12 @@ class Database:
         Returns:
             Token dict or None if not found/expired
         """
-        async with self._connection.cursor() as cursor:
-            await cursor.execute("""
-                SELECT * FROM api_tokens
-                WHERE token = ? AND expires_at > ?
-            """, (token, datetime.now().isoformat()))
+        async with self._reader().execute("""
+            SELECT * FROM api_tokens
+            WHERE token = ? AND expires_at > ?
+        """, (token, _now_us())) as cursor:
             row = await cursor.fetchone()
-            return dict(row) if row else None
+            return _row_to_dict(row) if row else None
 
     async def update_token_last_used(self, token: str) -> None:
         """Update token's last used timestamp.
@@ -830,11 +1212,10 @@ class Database:
         Args:
             token: Token string
         """
-        async with self._connection.cursor() as cursor:
-            await cursor.execute("""
-                UPDATE api_tokens SET last_used_at = ? WHERE token = ?
-            """, (datetime.now().isoformat(), token))
-            await self._connection.commit()
+        await self._connection.execute("""
+            UPDATE api_tokens SET last_used_at = ? WHERE token = ?
+        """, (_now_us(), token))
+        await self._connection.commit()
 
     async def delete_api_token(self, token: str) -> bool:
         """Delete an API token.
@@ -845,10 +1226,9 @@ class Database:
         Returns:
             True if token was deleted
         """
-        async with self._connection.cursor() as cursor:
-            await cursor.execute("""
-                DELETE FROM api_tokens WHERE token = ?
-            """, (token,))
+        async with self._connection.execute("""
+            DELETE FROM api_tokens WHERE token = ?
+        """, (token,)) as cursor:
             await self._connection.commit()
             return cursor.rowcount > 0
 
@@ -861,10 +1241,9 @@ class Database:
         Returns:
             Number of tokens deleted
         """
-        async with self._connection.cursor() as cursor:
-            await cursor.execute("""
-                DELETE FROM api_tokens WHERE username = ?
-            """, (username,))
+        async with self._connection.execute("""
+            DELETE FROM api_tokens WHERE username = ?
+        """, (username,)) as cursor:
             await self._connection.commit()
             return cursor.rowcount
 
@@ -874,10 +1253,9 @@ class Database:
         Returns:
             Number of tokens deleted
         """
-        async with self._connection.cursor() as cursor:
-            await cursor.execute("""
-                DELETE FROM api_tokens WHERE expires_at < ?
-            """, (datetime.now().isoformat(),))
+        async with self._connection.execute("""
+            DELETE FROM api_tokens WHERE expires_at < ?
+        """, (_now_us(),)) as cursor:
             await self._connection.commit()
             return cursor.rowcount
 
@@ -899,41 +1277,72 @@ class Database:
         Returns:
             Dict with counts of deleted records by table
         """
-        now = datetime.now()
+        now = _now_us()
         deleted = {}
 
-        async with self._connection.cursor() as cursor:
-            # Delete old readings
-            cutoff = (now - timedelta(days=readings_days)).isoformat()
-            await cursor.execute("""
-                DELETE FROM readings WHERE timestamp < ?
-            """, (cutoff,))
-            deleted["readings"] = cursor.rowcount
+        readings_cutoff = now - readings_days * _US_PER_DAY
+        deleted["readings"] = await self._delete_in_chunks("readings", readings_cutoff)
+        deleted["alerts"] = await self._delete_in_chunks(
+            "alerts", now - alerts_days * _US_PER_DAY)
+        deleted["events"] = await self._delete_in_chunks(
+            "system_events", now - events_days * _US_PER_DAY)
 
-            # Delete old alerts
-            cutoff = (now - timedelta(days=alerts_days)).isoformat()
-            await cursor.execute("""
-                DELETE FROM alerts WHERE timestamp < ?
-            """, (cutoff,))
-            deleted["alerts"] = cursor.rowcount
-
-            # Delete old events
-            cutoff = (now - timedelta(days=events_days)).isoformat()
-            await cursor.execute("""
-                DELETE FROM system_events WHERE timestamp < ?
-            """, (cutoff,))
-            deleted["events"] = cursor.rowcount
+        if deleted["readings"]:
+            await self._rebuild_rollup_bucket(readings_cutoff)
 
-            await self._connection.commit()
+        # Give the space used by the deleted pages' WAL frames back to the OS
+        if any(deleted.values()):
+            await self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
 
         logger.info(f"Data cleanup: {deleted}")
         return deleted
 
+    async def _rebuild_rollup_bucket(self, cutoff: int) -> None:
+        """Drop rollup buckets for deleted readings and redo the one at cutoff.
+
+        Args:
+            cutoff: Readings before this (epoch microseconds) were deleted
+        """
+        bucket = cutoff - cutoff % ROLLUP_BUCKET_US
+        await self._connection.execute("DELETE FROM readings_5m WHERE bucket <= ?", (bucket,))
+        await self._connection.execute(_ROLLUP_BACKFILL_SQL, (bucket, bucket + ROLLUP_BUCKET_US))
+        await self._connection.commit()
+
+    async def _delete_in_chunks(
+        self,
+        table: str,
+        cutoff: int,
+        chunk: int = DELETE_CHUNK_SIZE
+    ) -> int:
+        """Delete rows older than cutoff, committing every chunk rows.
+
+        Args:
+            table: Table with a timestamp column
+            cutoff: Delete rows with timestamp before this (epoch microseconds)
+            chunk: Maximum rows to delete per transaction
+
+        Returns:
+            Total number of rows deleted
+        """
+        total = 0
+        while True:
+            async with self._connection.execute(f"""
+                DELETE FROM {table} WHERE rowid IN (
+                    SELECT rowid FROM {table} WHERE timestamp < ? LIMIT ?
+                )
+            """, (cutoff, chunk)) as cursor:
+                count = cursor.rowcount
+            await self._connection.commit()
+            total += count
+            if count < chunk:
+                return total
+            # Let other tasks (and their writes) in between chunks
+            await asyncio.sleep(0)
+
 
 # Command-line interface for testing
 if __name__ == "__main__":
     import argparse
-    import asyncio
 
     logging.basicConfig(
         level=logging.INFO,
@@ -25,14 +25,16 @@ local and remote alerts.
 
 import argparse
 import asyncio
+import atexit
 import logging
 import os
+import queue
 import signal
 import sys
 import threading
 import time
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 
 # Add project root to path
@@ -79,7 +81,7 @@ def setup_logging(config, debug: bool = False) -> None:
     console_handler = logging.StreamHandler()
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # File handler (if configured)
     if config.logging.file:
@@ -95,7 +97,16 @@ def setup_logging(config, debug: bool = False) -> None:
         )
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Console/file I/O happens on a background listener thread; callers
+    # (including the BLE reader loop) only enqueue records
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    # Flush whatever is still queued on exit
+    atexit.register(listener.stop)
 
     # Reduce verbosity of some noisy libraries
     logging.getLogger("aiohttp").setLevel(logging.WARNING)
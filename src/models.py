@@ -11,9 +11,14 @@ This module contains all the data classes and enums used throughout the applicat
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+import sys
 from typing import Optional
 import uuid
 
+# dataclass(slots=True) needs Python 3.10+; on 3.9 fall back to a regular
+# (dict-backed) dataclass
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class AVAPSState(Enum):
     """AVAPS therapy device power state."""
@@ -97,7 +102,7 @@ class AlertType(Enum):
     TEST = "test"                      # Test alert
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class OxiReading:
     """A single reading from the pulse oximeter.
 
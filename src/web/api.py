@@ -23,6 +23,7 @@ from typing import Optional
 
 from flask import Blueprint, g, jsonify, request, session
 
+from src.config import ALERT_ITEM_FIELDS
 from src.models import Alert, AlertSeverity, AlertType
 from src.web.auth import api_login_required
 
@@ -30,6 +31,9 @@ logger = logging.getLogger(__name__)
 
 api_bp = Blueprint('api', __name__)
 
+# Readings written per chunk of a streamed CSV export
+EXPORT_CHUNK_ROWS = 500
+
 
 def run_async(coro):
     """Run async coroutine from sync Flask context."""
@@ -211,41 +215,52 @@ def export_readings_csv():
         end_time = datetime.now()
         start_time = end_time - timedelta(hours=hours)
 
-    # Fetch all readings (no limit for export)
-    readings = run_async(g.database.get_readings(
-        start_time=start_time,
-        end_time=end_time,
-        limit=500000,
-    ))
-
-    # Generate CSV
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Header row
-    writer.writerow(['Timestamp', 'SpO2 (%)', 'Heart Rate (BPM)', 'AVAPS State', 'Power (Watts)', 'Battery (%)', 'Valid'])
-
-    # Data rows
-    for r in readings:
-        writer.writerow([
-            r.get('timestamp', ''),
-            r.get('spo2', ''),
-            r.get('heart_rate', ''),
-            r.get('avaps_state', ''),
-            r.get('power_watts', '') if r.get('power_watts') is not None else '',
-            r.get('battery_level', '') if r.get('battery_level') is not None else '',
-            'Yes' if r.get('is_valid') else 'No',
-        ])
-
-    # Create response with CSV content
-    csv_content = output.getvalue()
-    output.close()
+    database = g.database  # g is gone once the response starts streaming
+
+    def generate():
+        """Yield the CSV a chunk of rows at a time."""
+        output = io.StringIO()
+        writer = csv.writer(output)
+
+        # Header row
+        writer.writerow(['Timestamp', 'SpO2 (%)', 'Heart Rate (BPM)', 'AVAPS State', 'Power (Watts)', 'Battery (%)', 'Valid'])
+
+        yield output.getvalue()
+
+        # Data rows, a page at a time (up to 500000 for export). Each page
+        # is a separate query, so no read snapshot stays open while the
+        # client downloads.
+        remaining = 500000
+        cursor = None
+        while remaining > 0:
+            readings, cursor = run_async(database.get_readings_page(
+                start_time=start_time,
+                end_time=end_time,
+                after=cursor,
+                limit=min(EXPORT_CHUNK_ROWS, remaining),
+            ))
+            output.seek(0)
+            output.truncate()
+            for r in readings:
+                writer.writerow([
+                    r.get('timestamp', ''),
+                    r.get('spo2', ''),
+                    r.get('heart_rate', ''),
+                    r.get('avaps_state', ''),
+                    r.get('power_watts', '') if r.get('power_watts') is not None else '',
+                    r.get('battery_level', '') if r.get('battery_level') is not None else '',
+                    'Yes' if r.get('is_valid') else 'No',
+                ])
+            yield output.getvalue()
+            remaining -= len(readings)
+            if cursor is None:
+                break
 
     # Generate filename with date range
     filename = f"o2monitor_{start_time.strftime('%Y%m%d')}_{end_time.strftime('%Y%m%d')}.csv"
 
     return Response(
-        csv_content,
+        generate(),
         mimetype='text/csv',
         headers={'Content-Disposition': f'attachment; filename={filename}'}
     )
@@ -505,16 +520,7 @@ def get_config():
 
     return jsonify({
         'alerts': {
-            'spo2_critical_off_therapy': _alert_to_dict(config.alerts.spo2_critical_off_therapy),
-            'spo2_critical_on_therapy': _alert_to_dict(config.alerts.spo2_critical_on_therapy),
-            'spo2_warning': _alert_to_dict(config.alerts.spo2_warning),
-            'hr_high': _alert_to_dict(config.alerts.hr_high),
-            'hr_low': _alert_to_dict(config.alerts.hr_low),
-            'disconnect': _alert_to_dict(config.alerts.disconnect),
-            'no_therapy_at_night_info': _alert_to_dict(config.alerts.no_therapy_at_night_info),
-            'no_therapy_at_night_high': _alert_to_dict(config.alerts.no_therapy_at_night_high),
-            'battery_warning': _alert_to_dict(config.alerts.battery_warning),
-            'battery_critical': _alert_to_dict(config.alerts.battery_critical),
+            **{name: _alert_to_dict(getattr(config.alerts, name)) for name in ALERT_ITEM_FIELDS},
             'sleep_hours': {
                 'start': config.alerts.sleep_hours.start,
                 'end': config.alerts.sleep_hours.end,
@@ -603,11 +609,7 @@ def update_config():
             return fields_updated
 
         # Update each alert type
-        alert_types = ['spo2_critical_off_therapy', 'spo2_critical_on_therapy', 'spo2_warning',
-                       'hr_high', 'hr_low', 'disconnect',
-                       'no_therapy_at_night_info', 'no_therapy_at_night_high',
-                       'battery_warning', 'battery_critical']
-        for alert_name in alert_types:
+        for alert_name in ALERT_ITEM_FIELDS:
             if alert_name in alerts:
                 alert_config = getattr(config.alerts, alert_name)
                 updated.extend(_update_alert(alert_config, alerts[alert_name], alert_name))
@@ -293,6 +293,8 @@ def post_relay_batch():
     errors = []
     avaps_state = g.state_machine.avaps_state
     latest_reading = None
+    batch = []
+    batch_indices = []  # Position of each batch entry in readings_data
 
     for i, item in enumerate(readings_data):
         try:
@@ -310,6 +312,13 @@ def post_relay_batch():
                 rejected += 1
                 continue
 
+            # Anything sqlite can't bind would fail the whole batch insert
+            is_valid = item.get('is_valid', True)
+            if not isinstance(is_valid, (bool, int)):
+                errors.append(f"Reading {i}: is_valid must be a boolean")
+                rejected += 1
+                continue
+
             # Parse timestamp
             if 'timestamp' in item:
                 timestamp = datetime.fromisoformat(
@@ -327,36 +336,43 @@ def post_relay_batch():
                 heart_rate=heart_rate,
                 battery_level=int(item.get('battery_level', 0)),
                 movement=int(item.get('movement', 0)),
-                is_valid=item.get('is_valid', True),
+                is_valid=bool(is_valid),
             )
 
-            # Store in database
-            try:
-                run_async(
-                    g.database.insert_reading(
-                        reading=reading,
-                        avaps_state=avaps_state,
-                        source='relay'
-                    )
-                )
-            except TypeError:
-                run_async(
-                    g.database.insert_reading(
-                        reading=reading,
-                        avaps_state=avaps_state,
-                    )
-                )
-
-            accepted += 1
-
-            # Track latest reading for state machine update
-            if latest_reading is None or timestamp > latest_reading.timestamp:
-                latest_reading = reading
+            batch.append((reading, avaps_state))
+            batch_indices.append(i)
 
         except Exception as e:
             errors.append(f"Reading {i}: {str(e)}")
             rejected += 1
 
+    # Store all valid readings in one transaction
+    stored = []
+    if batch:
+        try:
+            run_async(g.database.insert_readings(batch, source='relay'))
+            stored = [reading for reading, _ in batch]
+        except Exception as e:
+            # Retry one at a time so a single bad reading only rejects itself
+            logger.error(f"Failed to store relay batch, storing readings individually: {e}")
+            for i, (reading, state) in zip(batch_indices, batch):
+                try:
+                    run_async(
+                        g.database.insert_reading(
+                            reading=reading,
+                            avaps_state=state,
+                            source='relay'
+                        )
+                    )
+                    stored.append(reading)
+                except Exception as item_error:
+                    errors.append(f"Reading {i}: {str(item_error)}")
+                    rejected += 1
+
+    accepted = len(stored)
+    if stored:
+        latest_reading = max(stored, key=lambda r: r.timestamp)
+
     # Update state machine with the most recent reading
     if latest_reading:
         _update_state_machine_with_relay(g.state_machine, latest_reading)
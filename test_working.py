@@ -40,14 +40,18 @@ class CheckmeO2Reader:
     def connect(self):
         """Connect with retry logic."""
         print(f"Connecting to {self.mac}...")
+        attempts = 0
         while True:
             try:
                 self.ble.connect()
                 print("Connected!")
                 return True
             except Exception as e:
-                print("Wait")
-                time.sleep(2)
+                # Exponential backoff: 0.5s, 1s, 2s ... capped at 30s
+                delay = min(30.0, 0.5 * (1 << min(attempts, 6)))
+                attempts += 1
+                print(f"Wait ({delay:g}s, attempt {attempts})")
+                time.sleep(delay)
 
     def calc_crc(self, data):
         """Calculate CRC for command packet."""
@@ -108,11 +112,15 @@ class CheckmeO2Reader:
 
     def handle_notification(self, value):
         """Handle incoming BLE notification."""
-        self.rx_buffer.extend(bytearray(value))
+        self.rx_buffer.extend(value)
 
         # Look for complete packet (starts with 0x55)
-        while len(self.rx_buffer) > 0 and self.rx_buffer[0] != 0x55:
-            self.rx_buffer = self.rx_buffer[1:]
+        idx = self.rx_buffer.find(0x55)
+        if idx < 0:
+            del self.rx_buffer[:]  # No sync byte, drop everything
+            return
+        if idx > 0:
+            del self.rx_buffer[:idx]
 
         if len(self.rx_buffer) < 8:
             return
@@ -126,7 +134,7 @@ class CheckmeO2Reader:
 
         # Extract packet
         packet = self.rx_buffer[:total_len]
-        self.rx_buffer = self.rx_buffer[total_len:]
+        del self.rx_buffer[:total_len]
 
         # Parse payload (skip 7-byte header)
         if pay_len == 0x0d:  # Sensor reading